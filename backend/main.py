@@ -5,26 +5,34 @@ FastAPI application with LSL integration for real-time neurofeedback
 Architecture:
 - Device Management: muselsl subprocess orchestration
 - LSL Streaming: Thread-based pull threads @ 20 Hz
-- Signal Processing: Multi-timescale FFT @ 10 Hz (parallel)
+- Signal Processing: Multi-timescale FFT @ 10 Hz (batched across devices)
 - Session Management: Protocol-based experimental sessions
 - Data Recording: CSV export with metadata
 - WebSocket Broadcast: Real-time feedback @ 10 Hz
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from contextlib import asynccontextmanager
+from types import MappingProxyType
 from pydantic import BaseModel
+import anyio
+import anyio.to_thread
+import functools
 import asyncio
-import json
 import logging
+import os
 import time
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+import orjson
 
 # Import ExG-Lab modules
 from src.devices import DeviceManager, LSLStreamHandler
 from src.processing import MultiScaleProcessor, RateController, ui_broadcast_loop
-from src.session import SessionManager, SessionPhase, DataRecorder
+from src.session import SessionManager, SessionPhase, DataRecorder, MarkerOutlet
 
 # Configure logging
 logging.basicConfig(
@@ -38,34 +46,106 @@ logger = logging.getLogger(__name__)
 # ==========================================
 
 class ConnectionManager:
-    """Manage WebSocket connections"""
+    """
+    Manage WebSocket connections
+
+    Clients that request the "msgpack" subprotocol receive binary msgpack
+    frames; all other clients receive JSON text frames.
+
+    Each client has a bounded outbound queue drained by its own sender task,
+    so broadcast() never waits on a slow client. When a queue is full the
+    oldest frame is dropped, and the sender always skips ahead to the newest
+    queued frame - metrics are snapshots, so stale frames are safe to discard.
+    """
+    MSGPACK_SUBPROTOCOL = "msgpack"
+    CLIENT_QUEUE_SIZE = 4  # Frames buffered per client (0.4s @ 10 Hz)
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        self.binary_connections: Set[WebSocket] = set()  # Subset using msgpack framing
+        self.outbound_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self.sender_tasks: Dict[WebSocket, asyncio.Task] = {}
+        self.has_clients = asyncio.Event()  # Set while at least one client is connected
 
     async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+        if self.MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", []):
+            await websocket.accept(subprotocol=self.MSGPACK_SUBPROTOCOL)
+            self.binary_connections.add(websocket)
+        else:
+            await websocket.accept()
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.CLIENT_QUEUE_SIZE)
+        self.outbound_queues[websocket] = queue
+        self.sender_tasks[websocket] = asyncio.create_task(self._sender(websocket, queue))
+        self.active_connections.add(websocket)
+        self.has_clients.set()
         logger.info(f"WebSocket client connected. Total clients: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        if websocket not in self.active_connections:
+            return  # Already removed (sender failure and receive loop both report it)
+
+        self.active_connections.discard(websocket)
+        self.binary_connections.discard(websocket)
+        self.outbound_queues.pop(websocket, None)
+        if not self.active_connections:
+            self.has_clients.clear()
+
+        task = self.sender_tasks.pop(websocket, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
         logger.info(f"WebSocket client disconnected. Total clients: {len(self.active_connections)}")
 
-    async def broadcast(self, message: str):
-        """Broadcast message to all connected clients"""
-        dead_connections = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"Error sending to client: {e}")
-                dead_connections.append(connection)
+    @property
+    def has_text_clients(self) -> bool:
+        return len(self.active_connections) > len(self.binary_connections)
 
-        # Remove dead connections
-        for conn in dead_connections:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain one client's outbound queue until it disconnects"""
+        try:
+            while True:
+                message = await queue.get()
+
+                # Only the newest snapshot matters - skip frames queued
+                # while the previous send was in flight
+                while not queue.empty():
+                    message = queue.get_nowait()
+
+                if isinstance(message, bytes):
+                    await websocket.send_bytes(message)
+                else:
+                    await websocket.send_text(message)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error sending to client: {e}")
+            self.disconnect(websocket)
+
+    async def broadcast(self, message: Optional[str], binary_message: Optional[bytes] = None):
+        """
+        Queue message for all connected clients.
+
+        Does not wait for any send - each client's sender task delivers at
+        its own pace. A client that falls behind loses its oldest queued
+        frame rather than delaying the producer or growing memory.
+
+        Args:
+            message: JSON text payload for text clients
+            binary_message: msgpack payload for binary clients (falls back to
+                message if not provided)
+        """
+        for connection, queue in self.outbound_queues.items():
+            if binary_message is not None and connection in self.binary_connections:
+                payload: Union[str, bytes] = binary_message
+            else:
+                payload = message
+
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                queue.get_nowait()  # Drop the stalest frame
+                queue.put_nowait(payload)
 
 
 # Global instances (initialized in lifespan)
@@ -75,12 +155,54 @@ processor: Optional[MultiScaleProcessor] = None
 rate_controller: Optional[RateController] = None
 session_manager: Optional[SessionManager] = None
 data_recorder: Optional[DataRecorder] = None
+marker_outlet: Optional[MarkerOutlet] = None
 
 # Stream handlers (device_name -> LSLStreamHandler)
 stream_handlers: Dict[str, LSLStreamHandler] = {}
 
+# Stopped handlers kept for reconnects (device_name -> LSLStreamHandler)
+# Reusing them keeps their preallocated buffers instead of building new ones
+idle_stream_handlers: Dict[str, LSLStreamHandler] = {}
+
 # Background tasks
-ui_broadcast_task = None
+ui_broadcast_task: Optional[asyncio.Task] = None
+ui_broadcast_stop: Optional[asyncio.Event] = None  # Set to stop ui_broadcast_task cooperatively
+
+# Thread limit for blocking calls run via run_in_threadpool (applied in lifespan)
+# Sized for one blocking call per device (max 4 devices) rather than AnyIO's
+# default of 40, to limit thread contention with pull/calc threads
+BLOCKING_THREAD_LIMIT = int(os.environ.get('EXG_BLOCKING_WORKERS', '4'))
+
+# Separate thread limit for long device calls (LSL stream wait up to 30s, muselsl
+# stop up to 3s + bluetoothctl) so connects/disconnects can't use up the shared
+# pool that sync endpoints and session file I/O run on (created in lifespan)
+DEVICE_THREAD_LIMIT = int(os.environ.get('EXG_DEVICE_WORKERS', '4'))
+device_call_limiter: Optional[anyio.CapacityLimiter] = None
+
+# Concurrent device connects (muselsl spawn + LSL discovery). Connects beyond this
+# wait their turn - a single Bluetooth adapter fails handshakes when overloaded
+MAX_PARALLEL_CONNECTS = int(os.environ.get('EXG_MAX_PARALLEL_CONNECTS', '2'))
+connect_slots = asyncio.Semaphore(MAX_PARALLEL_CONNECTS)
+
+# Minimum gap between muselsl spawns - back-to-back connection requests queue up
+# in the adapter's HCI command queue and slow every handshake down
+CONNECT_SPACING = float(os.environ.get('EXG_CONNECT_SPACING', '0.4'))
+connect_spacing_lock = asyncio.Lock()
+last_connect_spawn = 0.0  # time.monotonic() of the last spawn
+
+# LSL inlet buffer (seconds) - kept short so a stalled pull loop drops stale data
+# instead of replaying minutes of backlog (pylsl's default is 360s)
+LSL_BUFFER_SIZE = int(os.environ.get('LSL_BUFFER_SIZE', '2'))
+
+# BLE scan window for /api/devices/scan (seconds). Callers may ask for a shorter
+# one (?timeout=2) when the headbands are known to be on and advertising
+SCAN_TIMEOUT = float(os.environ.get('EXG_SCAN_TIMEOUT', '10'))
+MIN_SCAN_TIMEOUT, MAX_SCAN_TIMEOUT = 1.0, 30.0
+
+# Serialized bodies of rarely-changing list endpoints: key -> (version, JSON bytes)
+# Versions are bumped by SessionManager/DataRecorder when the underlying data changes
+response_cache: Dict[str, Tuple[int, bytes]] = {}
+RESPONSE_CACHE_EPOCH = f"{int(time.time()):x}"  # Keeps ETags unique across restarts
 
 
 # ==========================================
@@ -123,16 +245,23 @@ class MarkerRequest(BaseModel):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
-    global device_manager, processor, rate_controller, session_manager, data_recorder
-    global ui_broadcast_task
+    global device_manager, processor, rate_controller, session_manager, data_recorder, marker_outlet
+    global ui_broadcast_task, device_call_limiter
 
     logger.info("🚀 ExG-Lab Backend starting...")
 
+    # Bound the AnyIO worker threads used by run_in_threadpool (CSV finalization,
+    # session file reads, markers); device calls get their own limiter
+    anyio.to_thread.current_default_thread_limiter().total_tokens = BLOCKING_THREAD_LIMIT
+    device_call_limiter = anyio.CapacityLimiter(DEVICE_THREAD_LIMIT)
+
     # Initialize managers
     device_manager = DeviceManager()
-    processor = MultiScaleProcessor(sample_rate=256.0, max_workers=4)
+    processor = MultiScaleProcessor(sample_rate=256.0)
     data_recorder = DataRecorder(base_dir='./data/sessions')
-    session_manager = SessionManager(devices=[], data_recorder=data_recorder)
+    # Read-only live view of connected streams - no list rebuild on connect/disconnect
+    session_manager = SessionManager(devices=MappingProxyType(stream_handlers), data_recorder=data_recorder)
+    marker_outlet = MarkerOutlet()
 
     logger.info("✓ Managers initialized")
 
@@ -144,18 +273,20 @@ async def lifespan(app: FastAPI):
     # Cleanup
     logger.info("🛑 ExG-Lab Backend shutting down...")
 
-    # Cancel UI broadcast
+    # Stop UI broadcast (exits at its next tick boundary)
     if ui_broadcast_task:
-        ui_broadcast_task.cancel()
-        try:
-            await ui_broadcast_task
-        except asyncio.CancelledError:
-            pass
+        ui_broadcast_stop.set()
+        await ui_broadcast_task
 
     # Stop rate controller
     if rate_controller and rate_controller.running:
         rate_controller.stop()
 
+    # Stop muselsl and release the headbands (bluetoothctl disconnect) - without
+    # this they can stay locked to this adapter after a restart
+    if device_manager:
+        await run_device_call(device_manager.disconnect_all)
+
     # Stop all streams
     for handler in stream_handlers.values():
         handler.stop()
@@ -168,6 +299,10 @@ async def lifespan(app: FastAPI):
     if processor:
         processor.shutdown()
 
+    # Close marker stream
+    if marker_outlet:
+        marker_outlet.close()
+
     logger.info("✓ Shutdown complete")
 
 
@@ -179,19 +314,25 @@ app = FastAPI(
     title="ExG-Lab API",
     description="Multi-Device EEG Neurofeedback Platform",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson for every dict-returning endpoint
 )
 
 # CORS Middleware
+# Origins as a frozenset: exact-match O(1) membership test per request
+CORS_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.environ.get('CORS_ORIGINS', 'http://localhost:3000,http://127.0.0.1:3000').split(',')
+    if origin.strip()
+)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://127.0.0.1:3000",
-    ],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],     # Everything the UI calls
+    allow_headers=["Content-Type"],    # JSON request bodies
+    max_age=7200,                      # Let browsers reuse a preflight for 2h (Chrome's cap)
 )
 
 
@@ -199,6 +340,52 @@ app.add_middleware(
 # REST API Endpoints
 # ==========================================
 
+async def run_device_call(func: Callable, *args, **kwargs):
+    """
+    Run a long blocking device call (muselsl spawn/stop, LSL stream wait) in a
+    worker thread limited by device_call_limiter instead of the shared pool.
+
+    Args:
+        func: Blocking callable
+        *args, **kwargs: Passed to func
+    """
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs),
+        limiter=device_call_limiter
+    )
+
+
+async def cached_json_response(
+    request: Request,
+    key: str,
+    version: int,
+    build: Callable[[], Dict]
+) -> Response:
+    """
+    Serve a JSON body cached per data version, with ETag / If-None-Match support.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        key: Cache key (one per endpoint)
+        version: Current version of the underlying data
+        build: Blocking callable producing the response dict (run in threadpool on miss)
+    """
+    etag = f'W/"{key}-{RESPONSE_CACHE_EPOCH}-{version}"'
+    headers = {"ETag": etag}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    cached = response_cache.get(key)
+    if cached is None or cached[0] != version:
+        body = orjson.dumps(await run_in_threadpool(build))
+        response_cache[key] = (version, body)
+    else:
+        body = cached[1]
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @app.get("/")
 async def root():
     """API root endpoint"""
@@ -229,12 +416,33 @@ async def health_check():
 
 
 @app.get("/api/devices/scan")
-async def scan_devices():
-    """Scan for available Muse devices"""
+async def scan_devices(
+    refresh: bool = False,
+    expected: Optional[int] = Query(None, ge=1),
+    timeout: Optional[float] = None,
+    fresh: Optional[float] = Query(None, gt=0)
+):
+    """
+    Scan for available Muse devices (recent results are reused unless refresh=true).
+
+    Pass expected=N to return as soon as N headbands were found instead of
+    waiting out the full scan window, and timeout=S for a shorter (or longer)
+    window than EXG_SCAN_TIMEOUT (clamped to 1-30s). fresh=S only lists
+    headbands that advertised in the last S seconds; each entry's last_seen
+    gives its age in seconds (null if not seen since the backend started).
+    """
     logger.info("Scanning for devices...")
 
+    scan_timeout = SCAN_TIMEOUT if timeout is None else timeout
+    scan_timeout = min(max(scan_timeout, MIN_SCAN_TIMEOUT), MAX_SCAN_TIMEOUT)
+
     try:
-        devices = await device_manager.scan_devices_async(timeout=10.0)
+        devices = await device_manager.scan_devices_async(
+            timeout=scan_timeout,
+            force_refresh=refresh,
+            expected_count=expected,
+            max_age=fresh
+        )
 
         return {
             "success": True,
@@ -242,7 +450,8 @@ async def scan_devices():
                 {
                     "name": dev.name,
                     "address": dev.address,
-                    "status": "available"
+                    "status": "available",
+                    "last_seen": device_manager.seconds_since_seen(dev.address)
                 }
                 for dev in devices
             ]
@@ -253,16 +462,35 @@ async def scan_devices():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/devices/connect")
-async def connect_device(request: ConnectRequest):
-    """Connect to a Muse device and start LSL stream"""
-    global rate_controller, ui_broadcast_task
+async def connect_stream(request: ConnectRequest) -> Dict:
+    """
+    Start muselsl for one device, wait for its LSL stream and register the handler.
+
+    Shared by the single and multi-device connect endpoints. Safe to run
+    concurrently for different stream names.
+
+    Returns:
+        Response dict for the connected device
+
+    Raises:
+        HTTPException: If muselsl fails to start or the stream never appears
+    """
+    global rate_controller, ui_broadcast_task, ui_broadcast_stop, last_connect_spawn
 
     logger.info(f"Connecting device: {request.stream_name} at {request.address}")
 
-    try:
-        # Start muselsl subprocess
-        success = device_manager.connect_device(
+    # Limit simultaneous Bluetooth handshakes (one adapter handles only a few at once)
+    async with connect_slots:
+        # Space out spawns so parallel connects don't hit the adapter in the same instant
+        async with connect_spacing_lock:
+            delay = CONNECT_SPACING - (time.monotonic() - last_connect_spawn)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            last_connect_spawn = time.monotonic()
+
+        # Start muselsl subprocess (off the event loop - spawning can block)
+        success = await run_device_call(
+            device_manager.connect_device,
             address=request.address,
             stream_name=request.stream_name
         )
@@ -270,92 +498,132 @@ async def connect_device(request: ConnectRequest):
         if not success:
             raise HTTPException(status_code=500, detail="Failed to start muselsl stream")
 
-        # Poll for LSL stream availability (Bluetooth connection can take 10-30 seconds)
-        # Try to resolve stream every 2 seconds for up to 30 seconds total
+        # Wait for LSL stream availability (Bluetooth connection can take 10-30 seconds)
+        # Resolution returns as soon as muselsl publishes the stream, and gives up early
+        # if the muselsl subprocess exits (e.g., Bluetooth pairing failed) instead of
+        # waiting out the full timeout. Runs in a worker thread (pylsl blocks).
         logger.info(f"Waiting for LSL stream '{request.stream_name}' to appear...")
 
         max_wait_time = 30.0  # seconds
-        poll_interval = 2.0  # seconds
-        elapsed = 0.0
+        wait_start = time.time()
 
-        handler = None
-        while elapsed < max_wait_time:
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+        handler = idle_stream_handlers.pop(request.stream_name, None)
+        if handler is None:
+            handler = LSLStreamHandler(stream_name=request.stream_name)
 
-            logger.info(f"  Attempting to resolve stream (elapsed: {elapsed:.1f}s / {max_wait_time}s)...")
+        stream_started = await run_device_call(
+            handler.start,
+            timeout=max_wait_time,
+            max_buflen=LSL_BUFFER_SIZE,
+            keep_waiting=lambda: device_manager.is_device_healthy(request.stream_name)
+        )
 
-            # Try to connect to stream
-            handler = LSLStreamHandler(stream_name=request.stream_name)
-            stream_started = handler.start(timeout=poll_interval)
+    if not stream_started:
+        idle_stream_handlers[request.stream_name] = handler
 
-            if stream_started:
-                logger.info(f"✓ LSL stream '{request.stream_name}' found after {elapsed:.1f}s")
-                break
-            else:
-                # Stream not yet available, continue polling
-                handler = None
+        # Timeout or muselsl exited - stream never appeared
+        logger.error(f"LSL stream '{request.stream_name}' did not appear after {time.time() - wait_start:.1f}s")
+        await run_device_call(device_manager.disconnect_device, request.stream_name)
+        raise HTTPException(
+            status_code=500,
+            detail=f"LSL stream did not appear (waited up to {max_wait_time}s). Check muselsl logs for Bluetooth connection errors."
+        )
 
-        if handler is None:
-            # Timeout - stream never appeared
-            logger.error(f"Timeout: LSL stream '{request.stream_name}' did not appear within {max_wait_time}s")
-            device_manager.disconnect_device(request.stream_name)
-            raise HTTPException(
-                status_code=500,
-                detail=f"LSL stream did not appear within {max_wait_time}s. Check muselsl logs for Bluetooth connection errors."
-            )
+    logger.info(f"✓ LSL stream '{request.stream_name}' found after {time.time() - wait_start:.1f}s")
 
-        # Store handler
-        stream_handlers[request.stream_name] = handler
+    # Store handler
+    stream_handlers[request.stream_name] = handler
 
-        # Update session manager available devices
-        session_manager.devices = list(stream_handlers.keys())
+    # Add device to session if session is active
+    if session_manager.current_session is not None:
+        # Reconstruct device name from address (matches scan format)
+        short_id = request.address.replace(':', '')[-4:]
+        device_name = f"Muse S - {short_id}"
 
-        # Add device to session if session is active
-        if session_manager.current_session is not None:
-            # Reconstruct device name from address (matches scan format)
-            short_id = request.address.replace(':', '')[-4:]
-            device_name = f"Muse S - {short_id}"
-
-            session_manager.add_device_to_session(
-                address=request.address,
-                name=device_name,
-                stream_name=request.stream_name
-            )
+        session_manager.add_device_to_session(
+            address=request.address,
+            name=device_name,
+            stream_name=request.stream_name
+        )
 
-        # Start rate controller if first device
-        if len(stream_handlers) == 1:
-            rate_controller = RateController(
-                stream_handlers=stream_handlers,
-                processor=processor,
-                calc_rate_hz=10.0
+    # Start rate controller if first device
+    # (it shares the stream_handlers dict, so later devices are picked up automatically)
+    if rate_controller is None:
+        rate_controller = RateController(
+            stream_handlers=stream_handlers,
+            processor=processor,
+            calc_rate_hz=10.0
+        )
+        rate_controller.start()
+
+        # Start UI broadcast loop
+        ui_broadcast_stop = asyncio.Event()
+        ui_broadcast_task = asyncio.create_task(
+            ui_broadcast_loop(
+                rate_controller, ws_manager, session_manager,
+                broadcast_rate_hz=10.0, stop_event=ui_broadcast_stop
             )
-            rate_controller.start()
+        )
 
-            # Start UI broadcast loop
-            ui_broadcast_task = asyncio.create_task(
-                ui_broadcast_loop(rate_controller, ws_manager, session_manager, broadcast_rate_hz=10.0)
-            )
+        logger.info("✓ Rate controller and UI broadcast started")
 
-            logger.info("✓ Rate controller and UI broadcast started")
-        else:
-            # Update rate controller with new handlers
-            rate_controller.stream_handlers = stream_handlers
+    logger.info(f"✓ Device connected: {request.stream_name}")
 
-        logger.info(f"✓ Device connected: {request.stream_name}")
+    return {
+        "success": True,
+        "stream_name": request.stream_name,
+        "address": request.address,
+        "total_devices": len(stream_handlers)
+    }
 
-        return {
-            "success": True,
-            "stream_name": request.stream_name,
-            "address": request.address,
-            "total_devices": len(stream_handlers)
-        }
+
+@app.post("/api/devices/connect")
+async def connect_device(request: ConnectRequest):
+    """Connect to a Muse device and start LSL stream"""
+    try:
+        return await connect_stream(request)
 
     except Exception as e:
         logger.error(f"Error connecting device: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/devices/connect-all")
+async def connect_all_devices(requests: List[ConnectRequest]):
+    """
+    Connect several devices concurrently.
+
+    Bluetooth handshakes and LSL stream discovery overlap (up to
+    MAX_PARALLEL_CONNECTS at a time), so N devices take about as long as
+    the slowest one instead of the sum. One device failing does not
+    affect the others.
+    """
+    results = await asyncio.gather(
+        *(connect_stream(request) for request in requests),
+        return_exceptions=True
+    )
+
+    devices = []
+    for request, result in zip(requests, results):
+        if isinstance(result, BaseException):
+            detail = result.detail if isinstance(result, HTTPException) else str(result)
+            logger.error(f"Error connecting device {request.stream_name}: {detail}")
+            devices.append({
+                "success": False,
+                "stream_name": request.stream_name,
+                "address": request.address,
+                "error": detail
+            })
+        else:
+            devices.append(result)
+
+    return {
+        "success": all(device["success"] for device in devices),
+        "devices": devices,
+        "total_devices": len(stream_handlers)
+    }
+
+
 @app.post("/api/devices/disconnect/{stream_name}")
 async def disconnect_device(stream_name: str):
     """Disconnect a device"""
@@ -364,16 +632,14 @@ async def disconnect_device(stream_name: str):
     logger.info(f"Disconnecting device: {stream_name}")
 
     try:
-        # Stop stream handler
+        # Stop stream handler (joins the pull thread)
         if stream_name in stream_handlers:
-            stream_handlers[stream_name].stop()
-            del stream_handlers[stream_name]
-
-        # Stop muselsl subprocess
-        device_manager.disconnect_device(stream_name)
+            handler = stream_handlers.pop(stream_name)
+            await run_device_call(handler.stop)
+            idle_stream_handlers[stream_name] = handler
 
-        # Update session manager
-        session_manager.devices = list(stream_handlers.keys())
+        # Stop muselsl subprocess (waits for termination + bluetoothctl cleanup)
+        await run_device_call(device_manager.disconnect_device, stream_name)
 
         # Mark device as disconnected in session if session is active
         if session_manager.current_session is not None:
@@ -384,14 +650,11 @@ async def disconnect_device(stream_name: str):
             rate_controller.stop()
             rate_controller = None
 
-            # Cancel UI broadcast
-            if ui_broadcast_task:
-                ui_broadcast_task.cancel()
+            # Stop UI broadcast (exits at its next tick boundary)
+            if ui_broadcast_stop:
+                ui_broadcast_stop.set()
 
             logger.info("✓ Rate controller stopped (no devices)")
-        elif rate_controller:
-            # Update rate controller handlers
-            rate_controller.stream_handlers = stream_handlers
 
         return {
             "success": True,
@@ -419,14 +682,17 @@ async def get_device_status():
 
 
 @app.get("/api/protocols")
-async def list_protocols():
+async def list_protocols(request: Request):
     """List available experimental protocols"""
-    protocols = session_manager.list_protocols()
-
-    return {
-        "success": True,
-        "protocols": protocols
-    }
+    return await cached_json_response(
+        request,
+        "protocols",
+        session_manager.protocols_version,
+        lambda: {
+            "success": True,
+            "protocols": session_manager.list_protocols()
+        }
+    )
 
 
 @app.post("/api/session/start")
@@ -447,14 +713,16 @@ async def start_session(config: SessionConfigRequest):
 
         # Register all currently connected devices with the session
         # This handles the case where devices were connected before session started
-        logger.info(f"Connected stream handlers: {list(stream_handlers.keys())}")
-        logger.info(f"Device info available: {list(device_manager.device_info.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Connected stream handlers: %s", list(stream_handlers))
+            logger.info("Device info available: %s", list(device_manager.device_info))
 
         for stream_name, handler in stream_handlers.items():
             # Get device info from device manager
             if stream_name in device_manager.device_info:
                 device = device_manager.device_info[stream_name]
-                logger.info(f"Registering device: name={device.name}, address={device.address}, stream={stream_name}")
+                logger.info("Registering device: name=%s, address=%s, stream=%s",
+                            device.name, device.address, stream_name)
 
                 session_manager.add_device_to_session(
                     address=device.address,
@@ -466,7 +734,7 @@ async def start_session(config: SessionConfigRequest):
 
         # Get and log current session devices
         session_devices = session_manager.get_session_devices()
-        logger.info(f"✓ Session started with {len(session_devices)} registered device(s): {session_devices}")
+        logger.info("✓ Session started with %d registered device(s): %s", len(session_devices), session_devices)
 
         return {
             "success": True,
@@ -486,9 +754,10 @@ async def end_session():
 
     try:
         # Disconnect all devices before stopping session
-        session_manager.disconnect_all_devices(device_manager)
+        await run_device_call(session_manager.disconnect_all_devices, device_manager)
 
-        success = session_manager.stop_session()
+        # Stopping flushes and closes the CSV files
+        success = await run_in_threadpool(session_manager.stop_session)
 
         if not success:
             raise HTTPException(status_code=400, detail="No active session")
@@ -526,33 +795,46 @@ async def get_session_status():
 
 @app.post("/api/session/marker")
 async def insert_marker(marker: MarkerRequest):
-    """Insert event marker"""
+    """
+    Insert event marker.
+
+    Published on the LSL marker stream (time-aligned with the EEG streams) and,
+    while a session is recording, written to the session's markers.csv.
+    """
     logger.info(f"Inserting marker: {marker.label}")
 
-    # TODO: Implement marker storage in data recorder
-    # For now, just log it
+    def publish() -> float:
+        timestamp, lsl_timestamp = marker_outlet.push(marker.label, marker.timestamp)
+        data_recorder.record_marker(lsl_timestamp, timestamp, marker.label)
+        return timestamp
+
+    timestamp = await run_in_threadpool(publish)
 
     return {
         "success": True,
-        "timestamp": marker.timestamp or time.time()
+        "timestamp": timestamp
     }
 
 
 @app.get("/api/sessions")
-async def list_sessions():
+async def list_sessions(request: Request):
     """List all recorded sessions"""
-    sessions = data_recorder.list_sessions()
-
-    return {
-        "success": True,
-        "sessions": sessions
-    }
+    # Walks the sessions directory and parses every metadata.json - only on cache miss
+    return await cached_json_response(
+        request,
+        "sessions",
+        data_recorder.sessions_version,
+        lambda: {
+            "success": True,
+            "sessions": data_recorder.list_sessions()
+        }
+    )
 
 
 @app.get("/api/sessions/{session_id}")
 async def get_session_metadata(session_id: str):
     """Get metadata for specific session"""
-    metadata = data_recorder.get_session_metadata(session_id)
+    metadata = await run_in_threadpool(data_recorder.get_session_metadata, session_id)
 
     if metadata is None:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -576,7 +858,7 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             # Keep connection alive and listen for client messages
             data = await websocket.receive_text()
-            logger.debug(f"Received from client: {data}")
+            logger.debug("Received from client: %s", data)
 
             # TODO: Handle client messages (e.g., parameter adjustments)
 
@@ -593,10 +875,23 @@ async def websocket_endpoint(websocket: WebSocket):
 
 if __name__ == "__main__":
     import uvicorn
+
+    # Device streams, WebSocket clients and session state live in this
+    # process, so always run 1 worker until that state moves to a shared broker
+    # (e.g. Redis). Extra workers would each own a separate DeviceManager, and
+    # connects on one would be invisible to broadcasts on another. Platforms
+    # often export WEB_CONCURRENCY, so it is ignored here rather than honored.
+    requested_workers = os.environ.get("WEB_CONCURRENCY", os.environ.get("UVICORN_WORKERS", "1"))
+    if requested_workers.strip() != "1":
+        logger.warning(f"Ignoring WEB_CONCURRENCY/UVICORN_WORKERS={requested_workers} - ExG-Lab runs a single worker")
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
+        workers=1,
+        loop="auto",   # uvloop when uvicorn[standard] is installed, else asyncio
+        http="auto",   # httptools when installed, else h11
         log_level="info"
     )
@@ -3,5 +3,7 @@ Device Management - Muse headband discovery, connection, and monitoring
 """
 from .manager import DeviceManager
 from .stream import LSLStreamHandler
+from .ring_buffer import RingBuffer
+from .chunk_store import ChunkStore
 
-__all__ = ['DeviceManager', 'LSLStreamHandler']
+__all__ = ['DeviceManager', 'LSLStreamHandler', 'RingBuffer', 'ChunkStore']
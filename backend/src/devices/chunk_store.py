@@ -0,0 +1,173 @@
+"""
+Chunk Store - Growable NumPy store of timestamped multi-channel samples
+
+Replaces the list of (timestamp, sample) tuples in LSLStreamHandler's
+recording buffer:
+- Two contiguous arrays: timestamps (float64) and samples × channels
+- Appending a pulled chunk is two slice copies - no per-sample tuples or views
+- Capacity doubles when full (amortized O(1) append, like list.append), or
+  with spill=True full arrays are flushed to an anonymous temp file instead,
+  so memory stays bounded however long the recording runs
+- read() copies out a block of rows, so long recordings can be exported in
+  bounded memory (snapshot() loads everything at once)
+
+Threading:
+- Not thread-safe by itself - LSLStreamHandler guards it with its lock
+
+Usage:
+    store = ChunkStore(n_channels=4)
+    store.append(timestamps, chunk)     # chunk shape: (n_samples, 4)
+    timestamps, samples = store.snapshot()
+    timestamps, samples = store.read(start=0, count=15360)  # One block
+
+    long_store = ChunkStore(n_channels=4, spill=True)  # Bounded RSS
+"""
+
+import tempfile
+from typing import Sequence, Tuple
+import numpy as np
+
+
+class ChunkStore:
+    """
+    Unbounded, append-only buffer of (timestamp, sample) rows.
+
+    Rows are stored column-wise: one float64 timestamp array and one
+    (capacity, n_channels) sample array, grown geometrically - or, with
+    spill=True, kept at initial_capacity and flushed to disk when full.
+    """
+
+    def __init__(
+        self,
+        n_channels: int,
+        initial_capacity: int = 15360,
+        dtype=np.float32,
+        spill: bool = False
+    ):
+        """
+        Initialize chunk store.
+
+        Args:
+            n_channels: Number of channels per sample
+            initial_capacity: Rows allocated up front (default 15360 = 60s @ 256 Hz)
+            dtype: NumPy dtype of stored samples (timestamps are always float64)
+            spill: Flush full arrays to an anonymous temp file instead of
+                growing them (deleted automatically when the store is closed
+                or garbage collected)
+        """
+        if initial_capacity <= 0:
+            raise ValueError(f"initial_capacity must be positive, got {initial_capacity}")
+
+        self.n_channels = n_channels
+        self.timestamps = np.empty(initial_capacity, dtype=np.float64)
+        self.samples = np.empty((initial_capacity, n_channels), dtype=dtype)
+        self.count = 0  # Number of valid rows in memory
+
+        # On-disk rows: packed (timestamp, samples) records, oldest first
+        self.spill_file = tempfile.TemporaryFile() if spill else None
+        self.record_dtype = np.dtype([('timestamp', np.float64), ('samples', dtype, (n_channels,))])
+        self.spilled = 0  # Number of rows on disk
+
+    def __len__(self) -> int:
+        return self.spilled + self.count
+
+    @property
+    def capacity(self) -> int:
+        return self.timestamps.shape[0]
+
+    def append(self, timestamps: Sequence[float], samples: np.ndarray):
+        """
+        Append a chunk of samples.
+
+        Args:
+            timestamps: One timestamp per sample
+            samples: Array of shape (n_samples, n_channels)
+        """
+        n = len(timestamps)
+        if n == 0:
+            return
+
+        end = self.count + n
+        if end > self.capacity:
+            if self.spill_file is not None:
+                self._spill()
+                end = n
+            if end > self.capacity:
+                self._grow(max(2 * self.capacity, end))
+
+        self.timestamps[self.count:end] = timestamps
+        np.copyto(self.samples[self.count:end], samples, casting='same_kind')
+        self.count = end
+
+    def _spill(self):
+        """Append the in-memory rows to the spill file and empty the arrays"""
+        records = np.empty(self.count, dtype=self.record_dtype)
+        records['timestamp'] = self.timestamps[:self.count]
+        records['samples'] = self.samples[:self.count]
+
+        self.spill_file.seek(0, 2)  # Append
+        records.tofile(self.spill_file)
+        self.spilled += self.count
+        self.count = 0
+
+    def _grow(self, new_capacity: int):
+        """Reallocate both arrays, keeping the stored rows"""
+        timestamps = np.empty(new_capacity, dtype=np.float64)
+        samples = np.empty((new_capacity, self.n_channels), dtype=self.samples.dtype)
+        timestamps[:self.count] = self.timestamps[:self.count]
+        samples[:self.count] = self.samples[:self.count]
+        self.timestamps = timestamps
+        self.samples = samples
+
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copy out all stored rows (spilled rows are loaded into memory).
+
+        Returns:
+            (timestamps, samples) with shapes (n,) and (n, n_channels)
+        """
+        return self.read(0, len(self))
+
+    def read(self, start: int, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copy out up to count rows, oldest first, starting at row start.
+
+        Row indices span the spill file and the in-memory arrays, so they stay
+        valid as rows are spilled.
+
+        Args:
+            start: Index of the first row
+            count: Maximum number of rows
+
+        Returns:
+            (timestamps, samples) with shapes (m,) and (m, n_channels),
+            m <= count (m == 0 past the last row)
+        """
+        stop = min(start + count, len(self))
+        start = min(start, stop)
+
+        # Part still in memory (row spilled + i is at index i)
+        mem_start = max(start - self.spilled, 0)
+        mem_stop = max(stop - self.spilled, 0)
+        timestamps = self.timestamps[mem_start:mem_stop].copy()
+        samples = self.samples[mem_start:mem_stop].copy()
+
+        if start >= self.spilled:
+            return timestamps, samples
+
+        # Part on disk
+        disk_stop = min(stop, self.spilled)
+        self.spill_file.seek(start * self.record_dtype.itemsize)
+        records = np.fromfile(self.spill_file, dtype=self.record_dtype, count=disk_stop - start)
+        return (
+            np.concatenate((records['timestamp'], timestamps)),
+            np.concatenate((records['samples'], samples))
+        )
+
+    def clear(self):
+        """Discard all rows (storage is kept)"""
+        self.count = 0
+        if self.spilled:
+            self.spill_file.seek(0)
+            self.spill_file.truncate()
+            self.spilled = 0
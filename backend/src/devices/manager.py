@@ -14,6 +14,11 @@ Known Issues:
 Environment Variables:
 - MUSELSL_PATH: Custom path to muselsl binary (default: system PATH)
 - EXG_REQUIRE_HARDWARE: Raise error if no real devices found (default: true)
+- EXG_SCAN_TTL: Seconds a BLE scan result is reused (default: 15, 0 disables)
+- EXG_DEVICE_CACHE: Persist scan results across restarts (default: true)
+- EXG_DEVICE_CACHE_MAX_AGE: Seconds a persisted scan seeds the first scan (default: 300)
+- EXG_LOG_MUSELSL: Log muselsl output (default: true); false discards it via
+  /dev/null so nothing is registered with the output reader
 """
 
 import subprocess
@@ -21,26 +26,113 @@ import logging
 import time
 import re
 import os
+import selectors
 import shutil
+import signal
+import sys
 import threading
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import weakref
+from typing import AsyncIterator, Callable, List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass, asdict
+from pathlib import Path
 import asyncio
+import collections
+import concurrent.futures
+import functools
+import importlib.metadata
+import orjson
 from bleak import BleakScanner
 
 logger = logging.getLogger(__name__)
 
+# `muselsl list` output line: "Found device <NAME>, MAC Address <MAC>"
+# Whitespace/name classes exclude newlines so matches never span lines when
+# the pattern is run over the whole output at once
+MUSELSL_LIST_PATTERN = re.compile(
+    r'Found device[ \t]+([^,\n]+),[ \t]*MAC Address[ \t]+([0-9A-F:]+)',
+    re.IGNORECASE
+)
 
-@dataclass
+# muselsl version by (resolved binary path, binary mtime), so the metadata
+# lookup runs once per installed binary rather than once per DeviceManager
+_muselsl_version_cache: Dict[Tuple[str, float], Optional[str]] = {}
+
+# Line muselsl prints once the headband is connected and its LSL outlet is live
+# ("Streaming EEG PPG ACC GYRO...")
+MUSELSL_STREAMING_MARKER = 'Streaming'
+
+# stderr lines kept per device and logged when muselsl exits (tracebacks can be long)
+STDERR_TAIL_LINES = 200
+
+# Disk cache of the last scan (seeds the first scan after a restart)
+DEVICE_CACHE_PATH = Path(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+) / 'exg-lab' / 'devices.json'
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_muselsl_cmd() -> str:
+    """
+    Locate the muselsl binary (resolved once per process).
+
+    Tries the venv first (if running from venv), then falls back to
+    MUSELSL_PATH or the system PATH. Call _resolve_muselsl_cmd.cache_clear()
+    after changing the environment.
+
+    Returns:
+        Path or command name for muselsl
+    """
+    venv_muselsl = os.path.join(os.path.dirname(sys.executable), 'muselsl')
+    if os.path.exists(venv_muselsl):
+        return venv_muselsl
+    return os.environ.get('MUSELSL_PATH', 'muselsl')
+
+
+@dataclass(slots=True)
 class Device:
-    """Represents a discovered Muse device"""
+    """Represents a discovered Muse device (slotted - no per-instance __dict__)"""
     name: str          # e.g., "Muse S - 3C4F"
     address: str       # MAC address: "00:55:DA:B3:3C4F"
-    status: str        # "available", "connected", "streaming"
+    status: str        # "available", "connecting", "streaming", "disconnecting", "disconnected"
     battery: Optional[int] = None
     stream_name: Optional[str] = None
 
 
+class _SharedScanner:
+    """
+    One long-lived BleakScanner shared by all scans on an event loop.
+
+    Scans subscribe a detection listener instead of constructing their own
+    scanner, so repeat scans don't rebuild the BlueZ discovery filter and
+    D-Bus signal subscriptions. The scanner runs while at least one scan
+    is subscribed, so concurrent scans share a single discovery session.
+    """
+
+    def __init__(self):
+        self.scanner = BleakScanner(detection_callback=self._dispatch)
+        self.lock = asyncio.Lock()  # Serializes start/stop transitions
+        self.listeners: List[Callable] = []
+
+    def _dispatch(self, device, advertisement_data):
+        """Forward one advertisement to every subscribed scan"""
+        for listener in tuple(self.listeners):
+            listener(device, advertisement_data)
+
+    async def subscribe(self, listener: Callable):
+        """Add a scan listener, starting the scanner if it is the first"""
+        async with self.lock:
+            if not self.listeners:
+                await self.scanner.start()
+            self.listeners.append(listener)
+
+    async def unsubscribe(self, listener: Callable):
+        """Remove a scan listener, stopping the scanner if it was the last"""
+        async with self.lock:
+            self.listeners.remove(listener)
+            if not self.listeners:
+                await self.scanner.stop()
+
+
 class DeviceManager:
     """
     Manages Muse device connections using subprocess isolation.
@@ -53,42 +145,118 @@ class DeviceManager:
     - Subprocess monitoring can be async (future enhancement)
     - LSL streams are consumed by separate pull threads (see devices/stream.py)
 
+    Lifecycle:
+    - The owner calls disconnect_all() when done - the FastAPI lifespan does so
+      on shutdown, and `with DeviceManager() as manager:` does on block exit.
+      Only this path runs the bluetoothctl disconnect that releases headbands
+    - A weakref.finalize backstop kills leftover muselsl process groups if the
+      manager is dropped or the interpreter exits without it
+
     Example:
-        manager = DeviceManager()
-        devices = manager.scan_devices()
-        success = manager.connect_device(devices[0].address, "Muse_1")
-        ...
-        manager.disconnect_device("Muse_1")
+        with DeviceManager() as manager:
+            devices = manager.scan_devices()
+            success = manager.connect_device(devices[0].address, "Muse_1")
+            ...
+            manager.disconnect_device("Muse_1")
     """
 
-    def __init__(self):
+    def __init__(self, validate: bool = True):
         """
         Initialize device manager with hardware validation.
 
+        Args:
+            validate: Check muselsl now (fail fast at startup). With False the
+                check is deferred to the first connect_device(), so scan-only
+                users never touch muselsl
+
         Raises:
             RuntimeError: If muselsl is not available and EXG_REQUIRE_HARDWARE=true
         """
         self.connected_processes: Dict[str, subprocess.Popen] = {}
         self.device_info: Dict[str, Device] = {}
-        self.output_threads: Dict[str, threading.Thread] = {}  # Stream name -> output monitor thread
-
-        # Get muselsl path
-        # Try venv first (if running from venv), then fall back to system PATH
-        import sys
-        venv_muselsl = os.path.join(os.path.dirname(sys.executable), 'muselsl')
-        if os.path.exists(venv_muselsl):
-            self.muselsl_cmd = venv_muselsl
-        else:
-            self.muselsl_cmd = os.environ.get('MUSELSL_PATH', 'muselsl')
+
+        # Last-resort cleanup: terminates any muselsl still running when the manager
+        # is garbage collected or the interpreter exits (weakref.finalize runs at
+        # exit by default). Holds the dict, not self, so it sees later connects.
+        self._finalizer = weakref.finalize(self, DeviceManager._finalize, self.connected_processes)
+
+        # muselsl output: every device's pipe is drained by one shared reader thread
+        self._output_selector = selectors.DefaultSelector()
+        self._output_lock = threading.Lock()  # Guards selector (un)registration
+        self._output_thread: Optional[threading.Thread] = None  # Started on first connect
+
+        # Set when muselsl reports it is streaming (or when it exits) - see wait_until_streaming
+        self._streaming_events: Dict[str, threading.Event] = {}
+
+        # Event loop for synchronous scan_devices() calls, run on a daemon thread
+        # and reused across scans (created on first use)
+        self._scan_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._scan_loop_lock = threading.Lock()
+
+        # Persistent BLE scanner per event loop (the API loop and the scan_devices() loop)
+        self._scanners: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedScanner]" = \
+            weakref.WeakKeyDictionary()
+
+        # Scan currently running for scan_devices_async(): (task, expected_count,
+        # loop.time() when its window ends). Concurrent callers await it instead
+        # of starting their own (single-flight)
+        self._scan_inflight: Optional[Tuple[asyncio.Task, Optional[int], float]] = None
+
+        # Last BLE scan result: (time.monotonic() when it expires, devices)
+        # Discovery takes ~10s, so repeat scans within the TTL reuse it
+        self._scan_cache: Optional[Tuple[float, List[Device]]] = None
+        self._scan_ttl = float(os.environ.get('EXG_SCAN_TTL', '15'))
+
+        # time.monotonic() of the latest advertisement per Muse address, kept
+        # across scans (see max_age in scan_devices_async)
+        self._device_last_seen: Dict[str, float] = {}
+
+        # Persisted scan: the same headbands are used session after session, so a
+        # recent result from the previous run answers the first scan instantly
+        self.use_device_cache = os.environ.get('EXG_DEVICE_CACHE', 'true').lower() == 'true'
+        if self.use_device_cache:
+            self._load_device_cache(float(os.environ.get('EXG_DEVICE_CACHE_MAX_AGE', '300')))
+
+        # Adaptive health-check interval (see next_health_delay)
+        self._min_health_interval = 0.1  # seconds
+        self._max_health_interval = 5.0  # seconds
+        self._health_interval = self._min_health_interval
+
+        # Get muselsl path (venv first, then MUSELSL_PATH / system PATH)
+        self.muselsl_cmd = _resolve_muselsl_cmd()
 
         # Check if hardware is required (default: true for production)
         self.require_hardware = os.environ.get('EXG_REQUIRE_HARDWARE', 'true').lower() == 'true'
 
-        # Validate muselsl availability
-        self._validate_muselsl()
+        # Capture muselsl output into our log (pipe + shared reader thread), or discard it
+        self.log_muselsl = os.environ.get('EXG_LOG_MUSELSL', 'true').lower() == 'true'
+
+        # muselsl environment, built once: unbuffered output for real-time logging
+        self._subprocess_env = {**os.environ, 'PYTHONUNBUFFERED': '1'}
+
+        # Validate muselsl availability (now, or on first connect)
+        self._muselsl_validated = False
+        self._validation_lock = threading.Lock()
+        if validate:
+            self._ensure_muselsl()
 
         logger.info("DeviceManager initialized")
 
+    def _ensure_muselsl(self):
+        """
+        Validate muselsl once (thread-safe - concurrent connects validate once).
+
+        Raises:
+            RuntimeError: If muselsl not found and hardware is required
+        """
+        if self._muselsl_validated:
+            return
+
+        with self._validation_lock:
+            if not self._muselsl_validated:
+                self._validate_muselsl()
+                self._muselsl_validated = True
+
     def _validate_muselsl(self):
         """
         Validate that muselsl is available and check version.
@@ -116,41 +284,125 @@ class DeviceManager:
 
         logger.info(f"muselsl found at: {muselsl_path}")
 
-        # Attempt version detection via pip show (non-failing)
         try:
-            pip_result = subprocess.run(
-                ['pip', 'show', 'muselsl'],
-                capture_output=True,
-                text=True,
-                timeout=5.0
+            cache_key = (muselsl_path, os.stat(muselsl_path).st_mtime)
+        except OSError:
+            cache_key = (muselsl_path, 0.0)
+
+        if cache_key in _muselsl_version_cache:
+            version = _muselsl_version_cache[cache_key]
+        else:
+            version = self._probe_muselsl_version()
+            _muselsl_version_cache[cache_key] = version
+
+        if version is None:
+            return
+
+        logger.info(f"muselsl version: {version}")
+
+        # Warn about known buggy versions
+        if '2.2.2' in version:
+            logger.warning(
+                "muselsl v2.2.2 has known bugs (bluetoothctl EOF handling). "
+                "See docs/07-muselsl-bugfixes.md for workarounds."
             )
 
-            if pip_result.returncode == 0:
-                # Parse version from pip output
-                for line in pip_result.stdout.split('\n'):
-                    if line.startswith('Version:'):
-                        version = line.split(':', 1)[1].strip()
-                        logger.info(f"muselsl version: {version}")
-
-                        # Warn about known buggy versions
-                        if '2.2.2' in version:
-                            logger.warning(
-                                "muselsl v2.2.2 has known bugs (bluetoothctl EOF handling). "
-                                "See docs/07-muselsl-bugfixes.md for workarounds."
-                            )
-                        break
-            else:
-                logger.warning("Could not determine muselsl version via pip show")
+    def _probe_muselsl_version(self) -> Optional[str]:
+        """
+        Detect the installed muselsl version from package metadata (non-failing).
 
-        except Exception as e:
-            logger.warning(f"Version check failed: {e}")
+        Reads the installed distribution's metadata in-process - no pip
+        subprocess, so this costs milliseconds rather than ~0.5-1s.
 
-    async def _scan_with_bleak(self, timeout: float) -> List[Device]:
+        Returns:
+            Version string, or None if muselsl is not installed in this environment
+        """
+        try:
+            return importlib.metadata.version('muselsl')
+        except importlib.metadata.PackageNotFoundError:
+            # e.g. MUSELSL_PATH points at a binary from another environment
+            logger.warning("Could not determine muselsl version (package not installed in this environment)")
+            return None
+
+    async def iter_scan_devices(
+        self,
+        timeout: float = 10.0,
+        expected_count: Optional[int] = None
+    ) -> AsyncIterator[Device]:
+        """
+        Scan for Muse devices, yielding each one as soon as it is discovered.
+
+        Each headband is yielded on its first advertisement instead of after
+        the whole scan window. Stopping iteration early ends the scan.
+
+        Args:
+            timeout: Scan window in seconds
+            expected_count: Stop as soon as this many devices were found
+                (None = always scan the full window)
+
+        Yields:
+            Device objects (each address at most once)
+        """
+        found: asyncio.Queue = asyncio.Queue()
+        seen: Set[str] = set()
+
+        def on_detection(device, advertisement_data):
+            # Called on the event loop for every advertisement
+            name = advertisement_data.local_name or device.name
+
+            # Filter for Muse devices
+            if not name or 'muse' not in name.lower():
+                return
+
+            address = device.address.upper()
+            self._device_last_seen[address] = time.monotonic()
+            if address in seen:
+                return
+            seen.add(address)
+
+            # Create short display name (last 4 chars of MAC)
+            short_id = address.replace(':', '')[-4:]
+            found.put_nowait(Device(
+                name=f"Muse S - {short_id}",
+                address=address,
+                status="available"
+            ))
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        shared = self._scanners.get(loop)
+        if shared is None:
+            shared = self._scanners[loop] = _SharedScanner()
+
+        await shared.subscribe(on_detection)
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                try:
+                    device = await asyncio.wait_for(found.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+                logger.info(f"  Found: {device.name} ({device.address})")
+                yield device
+
+                if expected_count is not None and len(seen) >= expected_count:
+                    logger.info(f"All {expected_count} expected device(s) found - ending scan early")
+                    break
+        finally:
+            await shared.unsubscribe(on_detection)
+
+    async def _scan_with_bleak(self, timeout: float, expected_count: Optional[int] = None) -> List[Device]:
         """
         Scan for Muse devices using bleak directly (avoids subprocess issues).
 
         Args:
             timeout: Scan timeout in seconds
+            expected_count: End the scan once this many devices were found
 
         Returns:
             List of discovered Device objects
@@ -158,40 +410,143 @@ class DeviceManager:
         logger.info(f"Scanning for Muse devices with bleak (timeout={timeout}s)...")
 
         try:
-            # Use bleak's async scanner
-            devices_found = await BleakScanner.discover(timeout=timeout)
-            muse_devices = []
-
-            for device in devices_found:
-                # Filter for Muse devices
-                if device.name and 'muse' in device.name.lower():
-                    # Create short display name (last 4 chars of MAC)
-                    short_id = device.address.replace(':', '')[-4:]
-                    display_name = f"Muse S - {short_id}"
-
-                    muse_device = Device(
-                        name=display_name,
-                        address=device.address.upper(),
-                        status="available"
-                    )
-                    muse_devices.append(muse_device)
-                    logger.info(f"  Found: {display_name} ({device.address})")
-
-            return muse_devices
+            return [device async for device in self.iter_scan_devices(timeout, expected_count)]
 
         except Exception as e:
             logger.error(f"Bleak scan error: {e}")
             raise
 
-    async def scan_devices_async(self, timeout: float = 10.0) -> List[Device]:
+    def seconds_since_seen(self, address: str) -> Optional[float]:
+        """
+        Seconds since a device's latest advertisement.
+
+        Args:
+            address: MAC address of the device
+
+        Returns:
+            Age in seconds, or None if it was never seen by this process
+        """
+        last_seen = self._device_last_seen.get(address.upper())
+        return None if last_seen is None else time.monotonic() - last_seen
+
+    def _filter_fresh(self, devices: List[Device], max_age: Optional[float]) -> List[Device]:
+        """Drop devices that haven't advertised within max_age seconds (None = keep all)"""
+        if max_age is None:
+            return devices
+
+        cutoff = time.monotonic() - max_age
+        last_seen = self._device_last_seen
+        return [device for device in devices if last_seen.get(device.address, float('-inf')) >= cutoff]
+
+    def invalidate_scan_cache(self):
+        """Force the next scan to run a fresh BLE discovery"""
+        self._scan_cache = None
+
+    def _get_cached_scan(self, expected_count: Optional[int] = None) -> Optional[List[Device]]:
+        """
+        Return a copy of the cached scan result if still fresh, else None.
+
+        Args:
+            expected_count: Treat the cache as a miss if it holds fewer devices
+        """
+        cache = self._scan_cache
+        if cache is None or time.monotonic() >= cache[0]:
+            return None
+        if expected_count is not None and len(cache[1]) < expected_count:
+            return None
+        return list(cache[1])
+
+    def _store_scan(self, devices: List[Device], expected_count: Optional[int] = None):
+        """
+        Cache a scan result in memory and (if enabled) on disk.
+
+        A scan that ended early because expected_count devices were found may
+        have missed other headbands, so it is not cached - later scans without
+        expected_count would otherwise get the short list back.
+        """
+        if expected_count is not None and len(devices) >= expected_count:
+            return
+
+        self._scan_cache = (time.monotonic() + self._scan_ttl, devices)
+
+        if self.use_device_cache and devices:
+            self._save_device_cache(devices)
+
+    def _load_device_cache(self, max_age: float):
+        """
+        Seed the scan cache from the previous run's persisted scan.
+
+        Args:
+            max_age: Ignore persisted scans older than this (seconds)
+        """
+        try:
+            cached = orjson.loads(DEVICE_CACHE_PATH.read_bytes())
+            age = time.time() - cached['timestamp']
+            if not 0 <= age < max_age:
+                return
+
+            devices = [Device(**device) for device in cached['devices']]
+            self._scan_cache = (time.monotonic() + (max_age - age), devices)
+
+            # Last-seen times as monotonic clock values (wall clock on disk);
+            # caches written without them fall back to the scan time
+            now_wall, now_mono = time.time(), time.monotonic()
+            last_seen = cached.get('last_seen', {})
+            for device in devices:
+                seen_wall = last_seen.get(device.address, cached['timestamp'])
+                self._device_last_seen[device.address] = now_mono - (now_wall - seen_wall)
+            logger.info(f"Loaded {len(devices)} device(s) from scan cache ({age:.0f}s old)")
+
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable device cache {DEVICE_CACHE_PATH}: {e}")
+
+    def _save_device_cache(self, devices: List[Device]):
+        """Persist a scan result atomically (write temp file, then rename)"""
+        try:
+            DEVICE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = DEVICE_CACHE_PATH.with_suffix('.tmp')
+
+            # Last-seen times as wall clock - monotonic values don't survive a restart
+            now_wall, now_mono = time.time(), time.monotonic()
+            last_seen = {
+                device.address: now_wall - (now_mono - self._device_last_seen[device.address])
+                for device in devices
+                if device.address in self._device_last_seen
+            }
+
+            tmp_path.write_bytes(orjson.dumps({
+                'timestamp': now_wall,
+                'devices': [asdict(device) for device in devices],
+                'last_seen': last_seen
+            }))
+            os.replace(tmp_path, DEVICE_CACHE_PATH)
+
+        except Exception as e:
+            logger.warning(f"Could not write device cache {DEVICE_CACHE_PATH}: {e}")
+
+    async def scan_devices_async(
+        self,
+        timeout: float = 10.0,
+        force_refresh: bool = False,
+        expected_count: Optional[int] = None,
+        max_age: Optional[float] = None
+    ) -> List[Device]:
         """
         Scan for available Muse devices using bleak directly (async version).
 
         Args:
             timeout: Scan timeout in seconds (default 10s for reliable BLE discovery)
+            force_refresh: Ignore a cached result from a recent scan
+            expected_count: Return as soon as this many devices were found
+                instead of waiting out the timeout
+            max_age: Only return devices that advertised within this many
+                seconds (None = no filter). Drops cached devices that have
+                since been switched off or connected elsewhere
 
         Returns:
-            List of discovered Device objects
+            List of discovered Device objects (one per MAC address)
 
         Raises:
             RuntimeError: If scan fails and EXG_REQUIRE_HARDWARE=true
@@ -199,11 +554,22 @@ class DeviceManager:
         Note:
             Uses bleak directly instead of muselsl subprocess to avoid async conflicts.
             Bleak typically needs ~10 seconds for reliable BLE discovery.
+            Results are reused for EXG_SCAN_TTL seconds (except scans that
+            ended early at expected_count); connecting or disconnecting a
+            device invalidates them. The first scan after a
+            restart may be answered from the persisted device cache.
         """
+        if not force_refresh:
+            cached = self._get_cached_scan(expected_count)
+            if cached is not None:
+                logger.info(f"Using cached scan result ({len(cached)} device(s))")
+                return self._filter_fresh(cached, max_age)
+
         logger.info(f"Scanning for Muse devices (timeout={timeout}s)...")
 
         try:
-            devices = await self._scan_with_bleak(timeout)
+            devices = await self._scan_single_flight(timeout, expected_count)
+            self._store_scan(devices, expected_count)
 
             logger.info(f"Found {len(devices)} Muse device(s)")
 
@@ -215,7 +581,7 @@ class DeviceManager:
                     "  3. Device is in pairing mode (hold power button for 5 seconds)"
                 )
 
-            return devices
+            return self._filter_fresh(devices, max_age)
 
         except Exception as e:
             error_msg = f"Device scan error: {e}"
@@ -227,14 +593,97 @@ class DeviceManager:
                 logger.warning("Returning empty device list (development mode)")
                 return []
 
-    def scan_devices(self, timeout: float = 10.0) -> List[Device]:
+    async def _scan_single_flight(self, timeout: float, expected_count: Optional[int]) -> List[Device]:
+        """
+        Run a BLE scan, or share the result of the one already in progress.
+
+        UI refreshes often overlap a running scan; they join it rather than
+        waiting out a second window. A scan that may end early (expected_count)
+        is only joined by callers asking for the same count, and a scan whose
+        window ends after the caller's own timeout isn't joined at all (a
+        ?timeout=2 caller doesn't wait out a running 30s scan).
+
+        Args:
+            timeout: Scan timeout in seconds (for a new scan)
+            expected_count: End the scan once this many devices were found
+
+        Returns:
+            List of discovered Device objects (a fresh list per caller)
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+
+        inflight = self._scan_inflight
+        if (inflight is not None and not inflight[0].done()
+                and inflight[1] in (None, expected_count) and inflight[2] <= deadline):
+            logger.info("Scan already in progress - sharing its result")
+            task = inflight[0]
+        else:
+            # Runs alongside any longer in-flight scan (both listen to the shared scanner)
+            task = asyncio.ensure_future(self._scan_with_bleak(timeout, expected_count))
+            self._scan_inflight = (task, expected_count, deadline)
+
+        # Shielded: a cancelled caller (e.g. client went away) doesn't cancel the
+        # scan for the others
+        return list(await asyncio.shield(task))
+
+    def scan_devices(
+        self,
+        timeout: float = 10.0,
+        force_refresh: bool = False,
+        expected_count: Optional[int] = None
+    ) -> List[Device]:
         """
         Synchronous wrapper for scan_devices_async.
 
-        This is provided for backward compatibility, but scan_devices_async
-        should be preferred when calling from async contexts.
+        This is provided for backward compatibility. The scan runs on a
+        long-lived background event loop, so repeated calls don't create
+        and tear down a loop each time.
+
+        Raises:
+            RuntimeError: If called from a running event loop (it would block
+                that loop) - await scan_devices_async() there instead
         """
-        return asyncio.run(self._scan_with_bleak(timeout))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # No running loop - blocking is fine
+        else:
+            raise RuntimeError("scan_devices() called from a running event loop - use scan_devices_async()")
+
+        if not force_refresh:
+            cached = self._get_cached_scan(expected_count)
+            if cached is not None:
+                return cached
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._scan_with_bleak(timeout, expected_count),
+            self._get_scan_loop()
+        )
+        devices = future.result(timeout + 5.0)
+        self._store_scan(devices, expected_count)
+        return devices
+
+    def _get_scan_loop(self) -> asyncio.AbstractEventLoop:
+        """Get (starting on first use) the background loop used by scan_devices()"""
+        with self._scan_loop_lock:
+            if self._scan_loop is None:
+                loop = asyncio.new_event_loop()
+
+                def run_loop():
+                    loop.run_forever()
+                    loop.close()  # After _stop_scan_loop()
+
+                threading.Thread(target=run_loop, name="ble-scan-loop", daemon=True).start()
+                self._scan_loop = loop
+            return self._scan_loop
+
+    def _stop_scan_loop(self):
+        """Stop the background scan loop, if it was started (its thread closes it)"""
+        with self._scan_loop_lock:
+            loop, self._scan_loop = self._scan_loop, None
+
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
 
     def _parse_muselsl_list_output(self, output: str) -> List[Device]:
         """
@@ -252,56 +701,223 @@ class DeviceManager:
         """
         devices = []
 
-        # Pattern: "Found device <NAME>, MAC Address <MAC>"
-        pattern = r'Found device\s+([^,]+),\s*MAC Address\s+([0-9A-F:]+)'
-
-        for line in output.split('\n'):
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                name = match.group(1).strip()
-                address = match.group(2).strip().upper()
+        # One regex pass over the whole output (no per-line substrings)
+        for match in MUSELSL_LIST_PATTERN.finditer(output):
+            # Only the MAC is used (group 1, the advertised name, is ignored).
+            # Interned so repeated scans share one str per headband
+            address = sys.intern(match.group(2).upper())
 
-                # Create short display name (last 4 chars of MAC)
-                short_id = address.replace(':', '')[-4:]
-                display_name = f"Muse S - {short_id}"
+            # Create short display name (last 4 chars of MAC)
+            short_id = address.replace(':', '')[-4:]
+            display_name = f"Muse S - {short_id}"
 
-                device = Device(
-                    name=display_name,
-                    address=address,
-                    status="available"
-                )
-                devices.append(device)
-                logger.debug(f"  - {device.name} ({device.address})")
+            device = Device(
+                name=display_name,
+                address=address,
+                status="available"
+            )
+            devices.append(device)
+            logger.debug("  - %s (%s)", device.name, device.address)
 
         return devices
 
-    def _monitor_subprocess_output(self, stream_name: str, process: subprocess.Popen):
+    def _watch_output(self, stream_name: str, process: subprocess.Popen):
         """
-        Monitor subprocess output in real-time and log it.
-
-        Runs in a background thread to capture muselsl output as it happens.
+        Log a subprocess's output from the shared reader thread.
 
         Args:
             stream_name: Device stream name for logging
-            process: The subprocess to monitor
+            process: The subprocess to monitor (binary stdout/stderr pipes)
         """
         logger.info(f"Starting output monitor for {stream_name}")
 
+        # state = [stream name, trailing partial line(, stderr tail)]
+        self._register_with_reader(process.stdout, self._drain_output, [stream_name, b''])
+        self._register_with_reader(
+            process.stderr, self._collect_stderr,
+            [stream_name, b'', collections.deque(maxlen=STDERR_TAIL_LINES)]
+        )
+
+    def _watch_exit(self, stream_name: str, process: subprocess.Popen):
+        """
+        Get notified by the reader thread the moment a subprocess exits.
+
+        Uses a Linux pidfd, which becomes readable when the process dies, so
+        a crashed muselsl is reaped and marked disconnected immediately
+        instead of waiting for the next monitor_device_health() poll.
+        Without pidfd support (non-Linux, kernel < 5.3) polling still works.
+
+        Args:
+            stream_name: Device stream name
+            process: The subprocess to watch
+        """
         try:
-            for line in iter(process.stdout.readline, ''):
-                if not line:  # EOF
-                    break
+            pidfd = os.pidfd_open(process.pid)
+        except (AttributeError, OSError):
+            return  # Not supported - monitor_device_health() polling only
 
-                line = line.rstrip()
-                if line:
-                    # Prefix each line with device name for clarity
-                    logger.info(f"[{stream_name}] {line}")
+        self._register_with_reader(pidfd, self._on_process_exit, (stream_name, process))
 
-        except Exception as e:
-            logger.error(f"Error monitoring {stream_name} output: {e}")
-        finally:
+    def _register_with_reader(self, fileobj, handler, state):
+        """
+        Register a file object with the shared reader thread (started on first use).
+
+        Args:
+            fileobj: Pipe or file descriptor to wait on
+            handler: Called as handler(key, state) from the reader thread when readable
+            state: Per-registration state (stream name first)
+        """
+        with self._output_lock:
+            self._output_selector.register(fileobj, selectors.EVENT_READ, (handler, state))
+
+            if self._output_thread is None:
+                self._output_thread = threading.Thread(
+                    target=self._output_reader_loop,
+                    name="muselsl-output",
+                    daemon=True
+                )
+                self._output_thread.start()
+
+    def _unregister_from_reader(self, key: selectors.SelectorKey):
+        """Stop watching a file object (called from the reader thread)"""
+        with self._output_lock:
+            self._output_selector.unregister(key.fileobj)
+
+    def _output_reader_loop(self):
+        """
+        Reader thread main loop - drains every registered muselsl pipe.
+
+        One thread serves all devices: the selector wakes it only when some
+        pipe has output or some process exits, instead of one blocked
+        readline() thread per device.
+
+        Note:
+            Pipes must be drained until EOF no matter what - once a ~64 KB
+            kernel pipe buffer fills, muselsl blocks on write and its LSL
+            stream silently stalls.
+        """
+        while True:
+            try:
+                ready = self._output_selector.select(timeout=1.0)
+            except Exception as e:
+                logger.error(f"Output reader select failed: {e}")
+                time.sleep(1.0)
+                continue
+
+            for key, _ in ready:
+                handler, state = key.data
+                try:
+                    handler(key, state)
+                except Exception as e:
+                    logger.error(f"Error monitoring {state[0]}: {e}")
+
+    def _read_lines(self, key: selectors.SelectorKey, state: list) -> Optional[List[bytes]]:
+        """
+        Read what is available on a pipe and split it into complete lines.
+
+        Args:
+            key: Selector key of the pipe
+            state: Registration state; state[1] carries the trailing partial line
+
+        Returns:
+            Complete lines, or None at EOF (the pipe is then unregistered and
+            closed; a final partial line stays in state[1])
+        """
+        try:
+            chunk = os.read(key.fd, 65536)
+        except OSError:
+            chunk = b''
+
+        if not chunk:  # EOF - process exited
+            self._unregister_from_reader(key)
+            key.fileobj.close()
+            return None
+
+        lines = (state[1] + chunk).split(b'\n')
+        pending = lines.pop()  # Incomplete last line (empty if chunk ended with newline)
+
+        # Bound the carry-over if a process writes a huge line without newlines
+        if len(pending) > 65536:
+            lines.append(pending)
+            pending = b''
+        state[1] = pending
+
+        return lines
+
+    def _drain_output(self, key: selectors.SelectorKey, state: list):
+        """Log complete stdout lines as they arrive"""
+        stream_name = state[0]
+
+        lines = self._read_lines(key, state)
+        at_eof = lines is None
+        if at_eof:
+            lines = [state[1]]
+
+        for raw_line in lines:
+            # Undecodable bytes are replaced, never fatal
+            line = raw_line.decode('utf-8', errors='replace').rstrip()
+            if line:
+                # Prefix each line with device name for clarity
+                logger.info(f"[{stream_name}] {line}")
+
+                if line.startswith(MUSELSL_STREAMING_MARKER):
+                    self._mark_streaming(stream_name)
+
+        if at_eof:
             logger.info(f"Output monitor stopped for {stream_name}")
 
+    def _collect_stderr(self, key: selectors.SelectorKey, state: list):
+        """
+        Keep the last lines of stderr and log them once when the process exits.
+
+        A crashing muselsl can dump a long traceback - only the bounded tail
+        is kept (state[2] is a deque), so memory and logging work are capped.
+        """
+        stream_name, _, tail = state
+
+        lines = self._read_lines(key, state)
+        if lines is not None:
+            tail.extend(lines)  # Raw bytes - decoded only if dumped
+            return
+
+        tail.append(state[1])
+        text = '\n'.join(
+            line.decode('utf-8', errors='replace').rstrip() for line in tail if line.strip()
+        )
+        if text:
+            logger.warning(f"[{stream_name}] stderr (last {tail.maxlen} lines max):\n{text}")
+
+    def _mark_streaming(self, stream_name: str):
+        """Record that muselsl reported streaming and wake wait_until_streaming()"""
+        device = self.device_info.get(stream_name)
+        if device is not None and device.status == "connecting":
+            device.status = "streaming"
+
+        event = self._streaming_events.get(stream_name)
+        if event is not None:
+            event.set()
+
+    def _on_process_exit(self, key: selectors.SelectorKey, state: Tuple[str, subprocess.Popen]):
+        """Reap an exited subprocess and mark its device disconnected"""
+        stream_name, process = state
+
+        self._unregister_from_reader(key)
+        os.close(key.fd)
+
+        returncode = process.poll()  # Reaps it (no zombie until the next health check)
+
+        # Exits during disconnect_device()/disconnect_all() are expected
+        device = self.device_info.get(stream_name)
+        if device is not None and device.status != "disconnecting" \
+                and self.connected_processes.get(stream_name) is process:
+            logger.warning(f"Device {stream_name} subprocess exited (code {returncode})")
+            device.status = "disconnected"
+
+        # Wake wait_until_streaming() - it will see the device is not streaming
+        event = self._streaming_events.get(stream_name)
+        if event is not None:
+            event.set()
+
     def connect_device(self, address: str, stream_name: str) -> bool:
         """
         Connect to a Muse device and start LSL streaming.
@@ -318,23 +934,30 @@ class DeviceManager:
 
         Note:
             The subprocess runs in the background. Use disconnect_device() to stop it.
-            LSL stream will be available ~2-5 seconds after this returns.
+            LSL stream will be available ~2-5 seconds after this returns;
+            wait_until_streaming() blocks until muselsl reports it.
         """
         if stream_name in self.connected_processes:
             logger.warning(f"Device {stream_name} already connected")
             return False
 
+        try:
+            self._ensure_muselsl()
+        except RuntimeError:
+            return False  # Already logged by _validate_muselsl
+
         logger.info(f"Connecting {stream_name} to {address}...")
 
+        # A connected headband stops advertising - the cached scan is now stale
+        self.invalidate_scan_cache()
+
         try:
             # Start muselsl stream subprocess with auto backend
             # Command: muselsl stream --address <MAC> --name <STREAM_NAME>
             # Note: Omitting --backend flag to let muselsl auto-detect (avoids sudo prompt on Linux)
 
-            # Use unbuffered output for real-time logging
-            import os
-            env = os.environ.copy()
-            env['PYTHONUNBUFFERED'] = '1'
+            # Unread pipes block muselsl once full, so only pipe when the reader drains it
+            output = subprocess.PIPE if self.log_muselsl else subprocess.DEVNULL
 
             process = subprocess.Popen(
                 [
@@ -342,36 +965,37 @@ class DeviceManager:
                     '--address', address,
                     '--name', stream_name,
                 ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # Merge stderr into stdout for unified logging
-                text=True,
-                bufsize=1,  # Line buffered
-                env=env,
+                stdout=output,
+                stderr=output,  # Kept apart - only its tail is logged, on exit
+                bufsize=0,  # Raw pipe - the reader thread does its own line splitting
+                env=self._subprocess_env,
+                close_fds=True,  # Don't leak sockets/LSL handles into muselsl
+                # Own session: a terminal Ctrl-C reaches only the backend, which then
+                # stops muselsl in order during shutdown (disconnect_all)
+                start_new_session=True,
+                # No preexec_fn/shell/cwd, so CPython can spawn via vfork instead
+                # of copying the whole parent address space with fork()
             )
 
             # Store process handle
             self.connected_processes[stream_name] = process
+            self._streaming_events[stream_name] = threading.Event()
 
             # Store device info
             self.device_info[stream_name] = Device(
                 name=stream_name,
                 address=address,
-                status="connecting",  # Will change to "streaming" once LSL active
+                status="connecting",  # Changes to "streaming" once muselsl reports it
                 stream_name=stream_name
             )
 
             logger.info(f"✓ {stream_name} subprocess started (PID: {process.pid})")
             logger.info(f"  Command: {self.muselsl_cmd} stream --address {address} --name {stream_name}")
 
-            # Start output monitoring thread
-            monitor_thread = threading.Thread(
-                target=self._monitor_subprocess_output,
-                args=(stream_name, process),
-                name=f"muselsl-monitor-{stream_name}",
-                daemon=True
-            )
-            monitor_thread.start()
-            self.output_threads[stream_name] = monitor_thread
+            # Log its output and notice its exit from the shared reader thread
+            if self.log_muselsl:
+                self._watch_output(stream_name, process)
+            self._watch_exit(stream_name, process)
 
             return True
 
@@ -400,10 +1024,14 @@ class DeviceManager:
 
         logger.info(f"Disconnecting {stream_name}...")
 
+        # The released headband starts advertising again
+        self.invalidate_scan_cache()
+
         # Get device MAC address for Bluetooth cleanup
         device_address = None
         if stream_name in self.device_info:
             device_address = self.device_info[stream_name].address
+            self.device_info[stream_name].status = "disconnecting"  # Exit is expected now
 
         try:
             process = self.connected_processes[stream_name]
@@ -440,22 +1068,45 @@ class DeviceManager:
                 except Exception as e:
                     logger.warning(f"Failed to cleanup Bluetooth connection: {e}")
 
-            # Cleanup
+            # Cleanup (the reader thread unregisters the pipe when it reaches EOF)
             del self.connected_processes[stream_name]
+            self._streaming_events.pop(stream_name, None)
             if stream_name in self.device_info:
                 self.device_info[stream_name].status = "disconnected"
 
-            # Cleanup output monitor thread
-            if stream_name in self.output_threads:
-                # Thread will terminate when process stdout closes
-                del self.output_threads[stream_name]
-
             return True
 
         except Exception as e:
             logger.error(f"Error disconnecting {stream_name}: {e}")
             return False
 
+    def wait_until_streaming(self, stream_name: str, timeout: float) -> bool:
+        """
+        Block until muselsl reports that a device is streaming.
+
+        Wakes as soon as muselsl prints its streaming line or exits, instead
+        of sleeping and polling after connect_device().
+
+        Args:
+            stream_name: LSL stream name
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the device is streaming, False on timeout or exit
+
+        Note:
+            Relies on muselsl's output, so with EXG_LOG_MUSELSL=false it
+            returns False after the timeout - resolve the LSL stream instead.
+        """
+        event = self._streaming_events.get(stream_name)
+        if event is None:
+            return False
+
+        event.wait(timeout)
+
+        device = self.device_info.get(stream_name)
+        return device is not None and device.status == "streaming"
+
     def get_connected_devices(self) -> List[str]:
         """
         Get list of currently connected device stream names.
@@ -490,36 +1141,136 @@ class DeviceManager:
 
         Note:
             If a device is unhealthy, it should be disconnected and reconnected.
-            Auto-reconnection can be implemented in a background monitoring task.
+            Auto-reconnection can be implemented in a background monitoring task,
+            sleeping next_health_delay() seconds between calls.
         """
-        health_status = {}
-
-        for stream_name in list(self.connected_processes.keys()):
-            is_healthy = self.is_device_healthy(stream_name)
-            health_status[stream_name] = is_healthy
-
+        # One pass over (name, process) pairs - poll() directly rather than
+        # re-looking each name up via is_device_healthy()
+        health_status = {
+            stream_name: process.poll() is None  # None = still running
+            for stream_name, process in self.connected_processes.items()
+        }
+
+        for stream_name, is_healthy in health_status.items():
             if not is_healthy:
                 logger.warning(f"Device {stream_name} subprocess died!")
                 # Cleanup dead process
                 del self.connected_processes[stream_name]
-                if stream_name in self.device_info:
-                    self.device_info[stream_name].status = "disconnected"
+                self._streaming_events.pop(stream_name, None)
+                device = self.device_info.get(stream_name)
+                if device is not None:
+                    device.status = "disconnected"
+
+        # Back off while everything is healthy; check quickly again after a failure
+        if all(health_status.values()):
+            self._health_interval = min(self._health_interval * 2, self._max_health_interval)
+        else:
+            self._health_interval = self._min_health_interval
 
         return health_status
 
+    def next_health_delay(self) -> float:
+        """
+        Get the delay before the next monitor_device_health() call.
+
+        Starts at 0.1s and doubles after every all-healthy check up to 5s,
+        resetting to 0.1s when a device dies - so a periodic monitor costs
+        almost nothing while devices are stable.
+
+        Returns:
+            Delay in seconds
+        """
+        return self._health_interval
+
     def disconnect_all(self):
         """
         Disconnect all devices and cleanup.
 
-        Call this during shutdown to ensure clean termination.
+        Call this during shutdown to ensure clean termination (the FastAPI
+        lifespan and __exit__ do) - the finalizer only kills the processes.
         """
         logger.info("Disconnecting all devices...")
 
-        for stream_name in list(self.connected_processes.keys()):
-            self.disconnect_device(stream_name)
+        # Stop every muselsl at once under one shared deadline, so N devices take
+        # ~3s rather than up to 3s each. Each runs in its own session
+        # (start_new_session), so its process group also covers helpers it spawned
+        processes = list(self.connected_processes.values())
+
+        for device in self.device_info.values():
+            if device.status != "disconnected":
+                device.status = "disconnecting"  # Exits are expected now
+
+        for process in processes:
+            self._signal_process_group(process, signal.SIGTERM)
+
+        deadline = time.monotonic() + 3.0
+        for process in processes:
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                self._signal_process_group(process, signal.SIGKILL)
+
+        # Processes have exited by now - this only reaps them, releases the
+        # Bluetooth links and updates bookkeeping. bluetoothctl can take up to
+        # 5s per device, so devices are cleaned up in parallel
+        stream_names = list(self.connected_processes.keys())
+        if stream_names:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(stream_names),
+                thread_name_prefix="disconnect"
+            ) as executor:
+                executor.map(self.disconnect_device, stream_names)
+
+        self._stop_scan_loop()
 
         logger.info("All devices disconnected")
 
-    def __del__(self):
-        """Cleanup on destruction"""
+    @staticmethod
+    def _signal_process_group(process: subprocess.Popen, sig: int):
+        """Send a signal to a muselsl process group (falls back to the process itself)"""
+        try:
+            os.killpg(process.pid, sig)  # pgid == pid for start_new_session children
+        except ProcessLookupError:
+            pass  # Already exited
+        except PermissionError:
+            process.send_signal(sig)
+
+    def __enter__(self) -> 'DeviceManager':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disconnect everything when leaving a `with DeviceManager() as manager:` block"""
         self.disconnect_all()
+
+    @staticmethod
+    def _finalize(processes: Dict[str, subprocess.Popen]):
+        """
+        Terminate leftover muselsl subprocesses (weakref.finalize callback).
+
+        Unlike disconnect_all() this touches no manager state and does not log,
+        so it is safe during interpreter shutdown. Signals go to each muselsl
+        process group, like disconnect_all(), so helpers it spawned exit too.
+
+        Args:
+            processes: The manager's connected_processes dict
+        """
+        procs = [p for p in processes.values() if p.poll() is None]
+
+        # Signal all first, then wait, so shutdown takes one timeout, not one per device
+        for process in procs:
+            try:
+                DeviceManager._signal_process_group(process, signal.SIGTERM)
+            except OSError:
+                pass
+
+        deadline = time.monotonic() + 2.0
+        for process in procs:
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                try:
+                    DeviceManager._signal_process_group(process, signal.SIGKILL)
+                except OSError:
+                    pass
+            except OSError:
+                pass
@@ -0,0 +1,128 @@
+"""
+Ring Buffer - Fixed-size NumPy circular buffer for multi-channel EEG windows
+
+Replaces per-channel deques in LSLStreamHandler:
+- One contiguous (capacity, n_channels) array allocated once at stream start
+- O(1) amortized push of whole chunks (at most two slice copies on wrap)
+- Window reads are zero-copy views unless the window wraps around the end
+
+Threading:
+- Not thread-safe by itself - LSLStreamHandler guards it with its lock
+- Views returned by latest() alias the buffer; copy them before releasing
+  the lock if the pull thread may keep writing
+
+Usage:
+    ring = RingBuffer(capacity=1024, n_channels=4)
+    ring.push(chunk)              # chunk shape: (n_samples, 4)
+    window = ring.latest(512)     # shape: (512, 4), oldest sample first
+"""
+
+from typing import Optional
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed-capacity circular buffer of samples × channels.
+
+    Oldest samples are overwritten once the buffer is full, matching the
+    semantics of deque(maxlen=capacity).
+    """
+
+    def __init__(self, capacity: int, n_channels: int, dtype=np.float32):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Maximum number of samples retained (e.g., 1024 = 4s @ 256 Hz)
+            n_channels: Number of channels per sample
+            dtype: NumPy dtype of stored samples (float32 for EEG; use float64
+                for LSL timestamps, which need the extra precision)
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        self.capacity = capacity
+        self.n_channels = n_channels
+        self.buffer = np.zeros((capacity, n_channels), dtype=dtype)
+        self.head = 0   # Next write position
+        self.count = 0  # Number of valid samples (<= capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.buffer.dtype
+
+    def push(self, samples: np.ndarray):
+        """
+        Append a chunk of samples.
+
+        Args:
+            samples: Array of shape (n_samples, n_channels), or (n_samples,)
+                for a single-channel buffer
+        """
+        samples = np.asarray(samples)
+        if samples.ndim == 1:
+            samples = samples.reshape(-1, 1)
+
+        n = samples.shape[0]
+        if n == 0:
+            return
+
+        # Only the newest `capacity` samples can survive
+        if n > self.capacity:
+            samples = samples[-self.capacity:]
+            n = self.capacity
+
+        end = self.head + n
+        if end <= self.capacity:
+            np.copyto(self.buffer[self.head:end], samples, casting='same_kind')
+        else:
+            first = self.capacity - self.head
+            np.copyto(self.buffer[self.head:], samples[:first], casting='same_kind')
+            np.copyto(self.buffer[:n - first], samples[first:], casting='same_kind')
+
+        self.head = end % self.capacity
+        self.count = min(self.count + n, self.capacity)
+
+    def latest(self, n_samples: int) -> Optional[np.ndarray]:
+        """
+        Get the most recent samples in chronological order.
+
+        Args:
+            n_samples: Number of samples to return
+
+        Returns:
+            Array of shape (n_samples, n_channels) - a view when the window is
+            contiguous in memory, a copy when it wraps. None if fewer than
+            n_samples are stored.
+        """
+        if n_samples > self.count:
+            return None
+
+        # head == 0 means the last write ended exactly at the end of the array
+        end = self.head or self.capacity
+        start = end - n_samples
+
+        if start >= 0:
+            return self.buffer[start:end]
+
+        return np.concatenate((self.buffer[start:], self.buffer[:end]))
+
+    def last(self) -> Optional[np.ndarray]:
+        """
+        Get the most recent sample.
+
+        Returns:
+            Array of shape (n_channels,), or None if empty
+        """
+        if self.count == 0:
+            return None
+        return self.buffer[self.head - 1]
+
+    def clear(self):
+        """Discard all samples (storage is kept)"""
+        self.head = 0
+        self.count = 0
@@ -2,22 +2,26 @@
 LSL Stream Handler - Thread-safe EEG data acquisition from Lab Streaming Layer
 
 This module provides thread-safe access to LSL streams from Muse devices:
-- Non-blocking pulls at 20 Hz
+- Blocking pulls woken by LSL as data arrives (~20 Hz for Muse packets)
 - Thread-safe rolling buffers for multi-timescale processing
 - Critical buffer flushing to prevent FIFO staleness
 - Separate recording buffer for CSV export
 
 Architecture:
 - Uses pylsl.StreamInlet (blocking C extension, requires pure threading)
-- Rolling buffers: 4 channels × deque(maxlen=1024) for 4-second windows @ 256 Hz
-- Pull thread runs at 20 Hz (50ms intervals) independently from calc/UI threads
+- Rolling buffer: one NumPy RingBuffer (1024 samples × 4 channels) for 4-second windows @ 256 Hz
+- Recording buffer: a NumPy ChunkStore (timestamps + samples arrays) that
+  spills to an anonymous temp file, so its memory is bounded
+- EEG samples are float32 end-to-end (Muse streams cf_float32); timestamps stay float64
+- Pull thread wakes per ~50ms batch of samples, independently from calc/UI threads
 - All buffer access protected by threading.Lock
 
 Critical Design Decisions:
 1. BUFFER FLUSHING: LSL uses FIFO queue - must discard accumulated startup data
    before feedback to avoid showing 5-10 second old data
 2. THREAD SAFETY: Multiple threads read buffers (calc thread, recording thread)
-3. NON-BLOCKING: timeout=0.0 prevents blocking the pull thread
+3. EVENT-DRIVEN PULLS: pull_chunk blocks inside liblsl until a batch arrives
+   (bounded timeout so stop() is noticed) - no sleep-based pacing or jitter
 4. RATE DECOUPLING: Pull (20 Hz) ≠ Calc (10 Hz) ≠ UI (10 Hz)
 
 Usage:
@@ -29,19 +33,31 @@ Usage:
 
     # On shutdown:
     handler.stop()
-    recording_data = handler.get_recording_buffer()
+    timestamps, samples = handler.get_recording_buffer()
+
+    # Long sessions - export in bounded memory:
+    for timestamps, samples in handler.iter_recording_buffer():
+        ...
 """
 
 import logging
 import time
 import threading
-from typing import Optional, List, Tuple, Dict
-from collections import deque
+from typing import Callable, Iterator, Optional, List, Tuple, Dict
 import numpy as np
-from pylsl import StreamInlet, resolve_byprop, resolve_streams
+from pylsl import StreamInfo, StreamInlet, resolve_byprop, resolve_streams, cf_float32, cf_double64
+
+from .chunk_store import ChunkStore
+from .ring_buffer import RingBuffer
 
 logger = logging.getLogger(__name__)
 
+# LSL channel formats that pull_chunk can write straight into a NumPy buffer
+LSL_NUMPY_DTYPES = {
+    cf_float32: np.float32,
+    cf_double64: np.float64,
+}
+
 
 class LSLStreamHandler:
     """
@@ -50,7 +66,7 @@ class LSLStreamHandler:
     Manages StreamInlet lifecycle and provides buffered access to EEG data.
 
     Threading Model:
-    - Pull thread: Runs at 20 Hz, calls pull_chunk() continuously
+    - Pull thread: Blocks in pull_chunk() until ~50ms of samples arrive
     - Calc thread: Reads from rolling buffers at 10 Hz
     - Recording thread: Accesses recording buffer for CSV export
 
@@ -77,13 +93,24 @@ class LSLStreamHandler:
         self.n_channels: Optional[int] = None
         self.channel_names: List[str] = []
 
-        # Rolling buffers (one per channel) - thread-safe with lock
-        # deque provides O(1) append and automatic size limiting
-        self.rolling_buffers: Dict[str, deque] = {}
-        self.timestamps_buffer: deque = deque(maxlen=1024)  # Matching 4s @ 256 Hz
+        # Rolling buffers (samples × channels, plus timestamps) - thread-safe with lock
+        # Allocated in start() once sample rate and channel count are known
+        self.rolling_buffer: Optional[RingBuffer] = None
+        self.timestamps_buffer: Optional[RingBuffer] = None
 
         # Recording buffer (unlimited size) - for CSV export
-        self.recording_buffer: List[Tuple[float, np.ndarray]] = []
+        # Allocated in start() once channel count is known
+        self.recording_buffer: Optional[ChunkStore] = None
+
+        # Pull scratch buffer - pull_chunk writes into it directly (dest_obj),
+        # avoiding a fresh list-of-lists per pull. Allocated once channel count is known.
+        self.max_chunk_samples = 256  # Covers up to 1 second of data @ 256 Hz
+        self.pull_scratch: Optional[np.ndarray] = None
+
+        # Blocking pull parameters: return once pull_batch samples (~50ms) arrived,
+        # or after pull_timeout with whatever arrived - bounds stop() latency
+        self.pull_batch = 1  # Set in bind() from the sample rate
+        self.pull_timeout = 0.25  # seconds
 
         # Thread safety
         self.lock = threading.Lock()
@@ -94,24 +121,74 @@ class LSLStreamHandler:
 
         logger.info(f"LSLStreamHandler created for '{stream_name}'")
 
-    def start(self, timeout: float = 10.0) -> bool:
+    def start(
+        self,
+        timeout: float = 10.0,
+        max_buflen: int = 2,
+        keep_waiting: Optional[Callable[[], bool]] = None
+    ) -> bool:
         """
         Connect to LSL stream and start pull thread.
 
+        Equivalent to resolve() followed by bind(). A stopped handler can be
+        started again (e.g., after a device reconnect); its buffers are reused.
+
         Args:
             timeout: Maximum time to wait for stream to appear (seconds)
+            max_buflen: Inlet buffer length in seconds (see bind())
+            keep_waiting: Optional predicate checked while resolving (see resolve())
 
         Returns:
             True if connection successful, False otherwise
 
         Note:
             This performs CRITICAL buffer flushing to discard stale startup data.
+            Stream resolution returns as soon as the stream is found, so a long
+            timeout does not delay connection. Blocking - call from a worker
+            thread when used inside the asyncio event loop.
         """
-        logger.info(f"Connecting to LSL stream '{self.stream_name}'...")
+        stream_info = self.resolve(timeout=timeout, keep_waiting=keep_waiting)
+        if stream_info is None:
+            return False
+
+        return self.bind(stream_info, max_buflen=max_buflen)
+
+    def resolve(
+        self,
+        timeout: float = 10.0,
+        keep_waiting: Optional[Callable[[], bool]] = None,
+        poll_interval: float = 0.25
+    ) -> Optional[StreamInfo]:
+        """
+        Resolve the LSL stream by name without opening an inlet.
+
+        Resolves in short slices of poll_interval seconds. Each slice returns
+        as soon as the stream appears, and between slices keep_waiting is
+        checked so a dead publisher ends the wait early.
+
+        Args:
+            timeout: Maximum time to wait for stream to appear (seconds)
+            keep_waiting: Optional predicate; returning False aborts the wait
+                (e.g., the muselsl subprocess exited)
+            poll_interval: Length of each resolve slice (seconds)
+
+        Returns:
+            StreamInfo of the first matching stream, or None if not found
+        """
+        logger.info(f"Resolving LSL stream '{self.stream_name}'...")
 
         try:
             # Resolve stream by name
-            streams = resolve_byprop('name', self.stream_name, timeout=timeout)
+            deadline = time.monotonic() + timeout
+            streams = []
+            while True:
+                remaining = deadline - time.monotonic()
+                streams = resolve_byprop('name', self.stream_name, timeout=max(0.0, min(poll_interval, remaining)))
+                if streams or remaining <= poll_interval:
+                    break
+                if keep_waiting is not None and not keep_waiting():
+                    logger.error(f"Stopped waiting for stream '{self.stream_name}' - publisher is gone")
+                    return None
 
             if not streams:
                 logger.error(f"Stream '{self.stream_name}' not found within {timeout}s")
@@ -130,10 +207,39 @@ class LSLStreamHandler:
                         logger.info(f"    [{i+1}] name='{info.name()}' type='{info.type()}' source_id='{info.source_id()}'")
                         logger.info(f"         hostname='{info.hostname()}' channels={info.channel_count()} rate={info.nominal_srate()} Hz")
 
-                return False
+                return None
+
+            return streams[0]
+
+        except Exception as e:
+            logger.error(f"Failed to resolve '{self.stream_name}': {e}")
+            return None
+
+    def bind(self, stream_info: StreamInfo, max_buflen: int = 2) -> bool:
+        """
+        Open an inlet on an already-resolved stream and start the pull thread.
+
+        Buffers from a previous binding are cleared and reused when the
+        stream layout (sample rate, channel count, format) is unchanged.
+
+        Args:
+            stream_info: StreamInfo returned by resolve()
+            max_buflen: Inlet buffer length in seconds. Kept short (vs. the
+                360s LSL default) so a stalled consumer drops old samples
+                instead of growing memory and serving stale data later
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        if self.running:
+            logger.warning(f"Stream '{self.stream_name}' already running")
+            return False
 
+        logger.info(f"Connecting to LSL stream '{self.stream_name}'...")
+
+        try:
             # Create inlet
-            self.inlet = StreamInlet(streams[0], max_buflen=360)  # 360s buffer (LSL default)
+            self.inlet = StreamInlet(stream_info, max_buflen=max_buflen)
 
             # Get stream info
             info = self.inlet.info()
@@ -147,16 +253,39 @@ class LSLStreamHandler:
                 self.channel_names.append(ch.child_value("label"))
                 ch = ch.next_sibling()
 
+            # Preallocate pull destination matching the stream's sample format
+            dtype = LSL_NUMPY_DTYPES.get(info.channel_format())
+            scratch_shape = (self.max_chunk_samples, self.n_channels)
+            if dtype is None:
+                logger.warning(f"Channel format {info.channel_format()} not supported for zero-copy pulls")
+                self.pull_scratch = None
+            elif (self.pull_scratch is None or self.pull_scratch.shape != scratch_shape
+                    or self.pull_scratch.dtype != dtype):
+                self.pull_scratch = np.empty(scratch_shape, dtype=dtype)
+
+            # ~50ms per pull (one Muse packet is 12 samples @ 256 Hz)
+            self.pull_batch = min(self.max_chunk_samples, max(1, int(0.05 * self.sample_rate)))
+
             logger.info(f"Connected: {self.n_channels} channels @ {self.sample_rate} Hz")
             logger.info(f"Channels: {', '.join(self.channel_names)}")
 
-            # Initialize rolling buffers (one per channel)
+            # Initialize rolling buffers (preallocated once, reused across reconnects)
             max_samples = int(self.buffer_duration * self.sample_rate)
             with self.lock:
-                for ch_name in self.channel_names:
-                    self.rolling_buffers[ch_name] = deque(maxlen=max_samples)
-                self.timestamps_buffer = deque(maxlen=max_samples)
-                self.recording_buffer = []
+                if (self.rolling_buffer is not None
+                        and self.rolling_buffer.capacity == max_samples
+                        and self.rolling_buffer.n_channels == self.n_channels):
+                    self.rolling_buffer.clear()
+                    self.timestamps_buffer.clear()
+                else:
+                    self.rolling_buffer = RingBuffer(max_samples, self.n_channels, dtype=np.float32)
+                    self.timestamps_buffer = RingBuffer(max_samples, 1, dtype=np.float64)
+
+                if self.recording_buffer is not None and self.recording_buffer.n_channels == self.n_channels:
+                    self.recording_buffer.clear()
+                else:
+                    # Spills to a temp file every ~60s, so long sessions don't grow RAM
+                    self.recording_buffer = ChunkStore(self.n_channels, dtype=np.float32, spill=True)
 
             # CRITICAL: Flush inlet buffer to discard stale startup data
             self._flush_inlet_buffer()
@@ -220,7 +349,7 @@ class LSLStreamHandler:
 
         total_flushed = 0
         while True:
-            chunk, timestamps = self.inlet.pull_chunk(timeout=0.0, max_samples=1000)
+            _, timestamps = self._pull_chunk()
 
             if not timestamps:  # No more data available
                 break
@@ -231,48 +360,43 @@ class LSLStreamHandler:
 
     def _pull_loop(self):
         """
-        Pull thread main loop - runs at 20 Hz (50ms intervals).
+        Pull thread main loop - woken by LSL whenever a batch of samples arrives.
 
         Continuously pulls data from LSL inlet and updates rolling buffers.
         This runs independently from calc thread (10 Hz) and UI thread (10 Hz).
 
         Threading:
         - Runs in dedicated thread (daemon=True for clean shutdown)
-        - Non-blocking pulls (timeout=0.0)
+        - Blocking pulls: liblsl waits for data, so there is no sleep pacing and
+          samples are buffered as soon as a batch is complete
         - Thread-safe buffer updates via lock
         """
-        logger.info(f"Pull thread started for '{self.stream_name}' (20 Hz)")
+        logger.info(f"Pull thread started for '{self.stream_name}' ({self.pull_batch} samples/pull)")
 
-        pull_interval = 0.05  # 20 Hz = 50ms
+        # Bind loop invariants to locals (buffers are fixed for this thread's
+        # lifetime - bind() swaps them only before starting a new pull thread)
+        pull_chunk = self._pull_chunk
+        timeout, max_samples = self.pull_timeout, self.pull_batch
+        lock = self.lock
+        push_samples = self.rolling_buffer.push
+        push_timestamps = self.timestamps_buffer.push
+        record = self.recording_buffer.append
 
         while self.running:
-            start_time = time.time()
-
             try:
-                # Non-blocking pull (timeout=0.0)
-                # max_samples=256 covers up to 1 second of data @ 256 Hz
-                chunk, timestamps = self.inlet.pull_chunk(timeout=0.0, max_samples=256)
+                # Blocks until pull_batch samples arrived (or pull_timeout passed),
+                # writing into the preallocated scratch buffer
+                chunk, timestamps = pull_chunk(timeout=timeout, max_samples=max_samples)
 
                 if timestamps:  # Got data
-                    # Convert to numpy array (shape: [n_samples, n_channels])
-                    chunk = np.array(chunk)
 
                     # Update rolling buffers (thread-safe)
-                    with self.lock:
-                        for i, ch_name in enumerate(self.channel_names):
-                            self.rolling_buffers[ch_name].extend(chunk[:, i])
-
-                        self.timestamps_buffer.extend(timestamps)
+                    with lock:
+                        push_samples(chunk)
+                        push_timestamps(timestamps)
 
-                        # Add to recording buffer (unlimited size)
-                        for j, ts in enumerate(timestamps):
-                            self.recording_buffer.append((ts, chunk[j, :]))
-
-                # Rate limiting: Sleep to maintain 20 Hz
-                elapsed = time.time() - start_time
-                sleep_time = max(0, pull_interval - elapsed)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                        # Add to recording buffer (unlimited size) - whole chunk at once
+                        record(timestamps, chunk)
 
             except Exception as e:
                 logger.error(f"Error in pull loop for '{self.stream_name}': {e}")
@@ -280,6 +404,43 @@ class LSLStreamHandler:
 
         logger.info(f"Pull thread stopped for '{self.stream_name}'")
 
+    def _pull_chunk(
+        self,
+        timeout: float = 0.0,
+        max_samples: Optional[int] = None
+    ) -> Tuple[Optional[np.ndarray], List[float]]:
+        """
+        Pull up to max_samples samples.
+
+        Args:
+            timeout: Seconds liblsl may wait for samples (0.0 = only what is
+                already available)
+            max_samples: Maximum samples to return (default max_chunk_samples)
+
+        Returns:
+            (chunk, timestamps) where chunk has shape [n_samples, n_channels],
+            or None if no data was available. chunk may be a view of the
+            scratch buffer - valid only until the next pull, so callers copy
+            what they keep (RingBuffer.push/ChunkStore.append do).
+        """
+        if max_samples is None:
+            max_samples = self.max_chunk_samples
+
+        if self.pull_scratch is None:
+            chunk, timestamps = self.inlet.pull_chunk(timeout=timeout, max_samples=max_samples)
+            return (np.array(chunk) if timestamps else None), timestamps
+
+        _, timestamps = self.inlet.pull_chunk(
+            timeout=timeout,
+            max_samples=max_samples,
+            dest_obj=self.pull_scratch
+        )
+        if not timestamps:
+            return None, timestamps
+
+        # View of the filled rows - the buffers copy from it, so no extra copy here
+        return self.pull_scratch[:len(timestamps)], timestamps
+
     def get_recent_data(self, duration: float = 4.0) -> Optional[Dict[str, np.ndarray]]:
         """
         Get most recent N seconds of data from rolling buffers.
@@ -303,18 +464,15 @@ class LSLStreamHandler:
 
         with self.lock:
             # Check if we have enough data
-            if len(self.timestamps_buffer) < n_samples_needed:
+            if self.rolling_buffer is None or len(self.rolling_buffer) < n_samples_needed:
                 return None
 
-            # Extract most recent N samples from each channel
-            result = {}
-            for ch_name in self.channel_names:
-                # deque is efficient for this - get last N elements
-                buffer = self.rolling_buffers[ch_name]
-                recent = list(buffer)[-n_samples_needed:]
-                result[ch_name] = np.array(recent)
+            # Single copy of the window into channel-major layout: each channel
+            # becomes a contiguous row, and the result no longer aliases the
+            # ring buffer the pull thread keeps writing to
+            window = self.rolling_buffer.latest(n_samples_needed).T.copy()
 
-            return result
+        return {ch_name: window[i] for i, ch_name in enumerate(self.channel_names)}
 
     def get_data_age_ms(self) -> Optional[float]:
         """
@@ -327,10 +485,10 @@ class LSLStreamHandler:
             Age in milliseconds, or None if no data available
         """
         with self.lock:
-            if not self.timestamps_buffer:
+            if self.timestamps_buffer is None or len(self.timestamps_buffer) == 0:
                 return None
 
-            latest_timestamp = self.timestamps_buffer[-1]
+            latest_timestamp = float(self.timestamps_buffer.last()[0])
             current_time = time.time()
 
             age_ms = (current_time - latest_timestamp) * 1000
@@ -347,26 +505,56 @@ class LSLStreamHandler:
             Fill ratio (e.g., 0.5 = half full, 1.0 = completely full)
         """
         with self.lock:
-            max_len = self.timestamps_buffer.maxlen
-            current_len = len(self.timestamps_buffer)
-            return current_len / max_len if max_len > 0 else 0.0
+            if self.timestamps_buffer is None:
+                return 0.0
+            return len(self.timestamps_buffer) / self.timestamps_buffer.capacity
 
-    def get_recording_buffer(self) -> List[Tuple[float, np.ndarray]]:
+    def get_recording_buffer(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get entire recording buffer for CSV export.
 
         Thread-safe - can be called while pull thread is running.
 
         Returns:
-            List of (timestamp, sample_array) tuples
-            Each sample_array has shape (n_channels,)
+            (timestamps, samples) arrays with shapes (n,) and (n, n_channels)
 
         Note:
             This returns a COPY to prevent modification during export.
-            Recording buffer is unlimited size - may be large for long sessions.
+            Recording buffer is unlimited size - only ~60s is held in memory
+            while recording, but this loads the whole recording (spilled
+            samples included). Use iter_recording_buffer() to export long
+            sessions in bounded memory.
         """
         with self.lock:
-            return self.recording_buffer.copy()
+            if self.recording_buffer is None:
+                return np.empty(0, dtype=np.float64), np.empty((0, self.n_channels or 0), dtype=np.float32)
+            return self.recording_buffer.snapshot()
+
+    def iter_recording_buffer(self, block_size: int = 15360) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Iterate over the recording buffer in blocks, oldest first.
+
+        Thread-safe - the lock is held only while each block is copied, so the
+        pull thread keeps recording during a long export. Samples recorded
+        meanwhile are included.
+
+        Args:
+            block_size: Samples per block (default 15360 = 60s @ 256 Hz)
+
+        Yields:
+            (timestamps, samples) arrays with shapes (m,) and (m, n_channels)
+        """
+        start = 0
+        while True:
+            with self.lock:
+                if self.recording_buffer is None:
+                    return
+                timestamps, samples = self.recording_buffer.read(start, block_size)
+
+            if len(timestamps) == 0:
+                return
+            yield timestamps, samples
+            start += len(timestamps)
 
     def clear_recording_buffer(self):
         """
@@ -375,7 +563,8 @@ class LSLStreamHandler:
         Does NOT affect rolling buffers (which are for real-time processing).
         """
         with self.lock:
-            self.recording_buffer = []
+            if self.recording_buffer is not None:
+                self.recording_buffer.clear()
             logger.info(f"Recording buffer cleared for '{self.stream_name}'")
 
     def get_stream_info(self) -> Dict[str, any]:
@@ -394,7 +583,7 @@ class LSLStreamHandler:
                 'buffer_duration': self.buffer_duration,
                 'buffer_fill_ratio': self.get_buffer_fill_ratio(),
                 'data_age_ms': self.get_data_age_ms(),
-                'recording_samples': len(self.recording_buffer),
+                'recording_samples': len(self.recording_buffer) if self.recording_buffer is not None else 0,
                 'is_running': self.running,
             }
 
@@ -17,7 +17,7 @@ Threading Architecture (CRITICAL):
 │  - Single thread for all devices                                    │
 │  - Reads from rolling buffers (thread-safe)                         │
 │  - Computes FFT + band powers using MultiScaleProcessor             │
-│  - Uses ThreadPoolExecutor for parallel device processing           │
+│  - Batches all devices into one FFT call per timescale              │
 │  - Independent rate: 10 Hz (100ms intervals)                        │
 │  - Writes results to shared state (thread-safe with Lock)           │
 └──────────────────────────────────────────────────────────────────────┘
@@ -46,9 +46,9 @@ Performance Budget (10 Hz = 100ms):
 - Pull threads: <5ms each (non-blocking, minimal work)
 - Calc thread:
   * 1 device: ~15ms (sequential FFT)
-  * 4 devices: ~40ms (parallel FFT with ThreadPoolExecutor)
+  * 4 devices: ~40ms (batched FFT across devices)
   * Margin: 60ms buffer
-- UI thread: <10ms (JSON serialization + WebSocket send)
+- UI thread: <10ms (orjson/msgpack serialization once per tick + WebSocket send)
 
 Usage:
     # Create rate controller
@@ -73,12 +73,19 @@ import logging
 import time
 import threading
 import asyncio
-from typing import Dict, List, Optional, Callable
+from collections import deque
+from typing import Deque, Dict, List, Optional, Callable
 from dataclasses import dataclass, asdict
-import json
+import numpy as np
+import orjson
+import ormsgpack
 
 logger = logging.getLogger(__name__)
 
+# Band powers come out of NumPy as np.float64 - let orjson/ormsgpack serialize them natively
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+ORMSGPACK_OPTIONS = ormsgpack.OPT_SERIALIZE_NUMPY
+
 
 @dataclass
 class DeviceMetrics:
@@ -131,7 +138,9 @@ class RateController:
         Initialize rate controller.
 
         Args:
-            stream_handlers: Dict mapping device_name -> LSLStreamHandler instance
+            stream_handlers: Dict mapping device_name -> LSLStreamHandler instance.
+                Held by reference - the owner adds/removes devices in place and
+                each calc tick sees the current set (never reassign it)
             processor: MultiScaleProcessor instance for FFT computation
             calc_rate_hz: Calculation rate in Hz (default 10.0 = 100ms intervals)
         """
@@ -149,7 +158,12 @@ class RateController:
         self.running = False
 
         # Performance monitoring
-        self.calc_loop_times: List[float] = []
+        self.calc_loop_times: Deque[float] = deque(maxlen=100)
+
+        # Stats snapshot published by the calc thread once per tick. Readers
+        # (e.g., /api/health) get it without locking: the calc thread replaces
+        # the dict wholesale (atomic reference assignment) and never mutates it
+        self._stats_snapshot: Dict[str, float] = {}
 
         logger.info(f"RateController initialized ({calc_rate_hz} Hz calc rate)")
 
@@ -206,30 +220,33 @@ class RateController:
 
         For each iteration:
         1. Read recent data from all stream handlers (thread-safe)
-        2. Process in parallel using MultiScaleProcessor
+        2. Process all devices in one batched FFT per timescale
         3. Update shared metrics state (thread-safe)
         4. Sleep to maintain 10 Hz rate
 
         Performance:
         - Target: <100ms per iteration (10 Hz)
-        - Actual: ~40ms for 4 devices with parallel FFT
+        - Actual: ~40ms for 4 devices with batched FFT
         - Margin: ~60ms buffer for safety
         """
         logger.info(f"Calc thread started ({self.calc_rate_hz} Hz)")
 
         while self.running:
-            loop_start = time.time()
+            # Monotonic clock for loop timing; wall clock read once per tick and
+            # shared by every device's metrics timestamp
+            loop_start = time.perf_counter()
+            tick_timestamp = time.time()
 
             try:
                 # Step 1: Gather data from all devices
+                # tuple() copies the items in one C-level call (atomic under the GIL),
+                # so devices (dis)connecting from the event loop can't break iteration
                 device_data = []
-                for device_name, handler in self.stream_handlers.items():
+                for device_name, handler in tuple(self.stream_handlers.items()):
                     # Check if buffer is sufficiently filled (>90% for stable feedback)
                     fill_ratio = handler.get_buffer_fill_ratio()
                     if fill_ratio < 0.9:
-                        logger.debug(
-                            f"{device_name} buffer not ready ({fill_ratio*100:.0f}% full)"
-                        )
+                        logger.debug("%s buffer not ready (%.0f%% full)", device_name, fill_ratio * 100)
                         continue
 
                     # Get 4-second window (for stable timescale)
@@ -244,14 +261,14 @@ class RateController:
                         'handler': handler
                     })
 
-                # Step 2: Process all devices at 4-second timescale (parallel)
+                # Step 2: Process all devices at 4-second timescale (batched)
                 if device_data:
                     results_4s = self.processor.process_multiple_devices(
                         device_data,
                         timescale=4.0
                     )
 
-                    # Step 3: Process at 1s and 2s timescales (parallel)
+                    # Step 3: Process at 1s and 2s timescales (batched)
                     results_1s = self.processor.process_multiple_devices(
                         device_data,
                         timescale=1.0
@@ -319,7 +336,7 @@ class RateController:
                             },
                             data_age_ms=quality_metrics[device_name]['data_age_ms'],
                             signal_quality=quality_metrics[device_name]['signal_quality'],
-                            timestamp=time.time()
+                            timestamp=tick_timestamp
                         )
 
                         new_metrics[device_name] = metrics
@@ -330,16 +347,15 @@ class RateController:
                             self.latest_metrics.update(new_metrics)
 
                 # Performance monitoring
-                loop_time = (time.time() - loop_start) * 1000  # ms
+                elapsed = time.perf_counter() - loop_start
+                loop_time = elapsed * 1000  # ms
                 self.calc_loop_times.append(loop_time)
-                if len(self.calc_loop_times) > 100:
-                    self.calc_loop_times.pop(0)
+                self._publish_performance_stats()
 
                 if loop_time > 100:
                     logger.warning(f"Calc loop exceeded budget: {loop_time:.1f}ms")
 
                 # Rate limiting: Sleep to maintain 10 Hz
-                elapsed = time.time() - loop_start
                 sleep_time = max(0, self.calc_interval - elapsed)
                 if sleep_time > 0:
                     time.sleep(sleep_time)
@@ -362,14 +378,15 @@ class RateController:
         with self.metrics_lock:
             return self.latest_metrics.copy()
 
-    def get_metrics_json(self) -> str:
+    def get_metrics_dict(self) -> Dict:
         """
-        Get latest metrics as JSON string for WebSocket broadcast.
+        Get latest metrics as a dict in frontend-compatible format.
 
-        Converts DeviceMetrics to frontend-compatible format.
+        Callers that add extra fields (e.g., ui_broadcast_loop) should use this
+        and serialize once, instead of round-tripping through get_metrics_json().
 
         Returns:
-            JSON string matching frontend interface (wrapped in object for extensibility)
+            Dict matching frontend interface (wrapped in object for extensibility)
         """
         metrics = self.get_latest_metrics()
 
@@ -391,37 +408,63 @@ class RateController:
             })
 
         # Wrap in object to allow additional fields (e.g., device_status, session_info)
-        output = {
+        return {
             'devices': devices,
             'timestamp': time.time()
         }
 
-        return json.dumps(output)
+    def get_metrics_json(self) -> str:
+        """
+        Get latest metrics as JSON string for WebSocket broadcast.
+
+        Returns:
+            JSON string matching frontend interface
+        """
+        return orjson.dumps(self.get_metrics_dict(), option=ORJSON_OPTIONS).decode()
 
     def get_performance_stats(self) -> Dict[str, float]:
         """
         Get performance statistics for monitoring.
 
+        Lock-free: returns the snapshot last published by the calc thread
+        (treat it as read-only).
+
         Returns:
-            Dict with calc_loop_avg_ms, calc_loop_max_ms, etc.
+            Dict with calc_loop_avg_ms, calc_loop_max_ms, etc. (empty before first tick)
         """
-        if not self.calc_loop_times:
-            return {}
+        return self._stats_snapshot
 
-        return {
-            'calc_loop_avg_ms': sum(self.calc_loop_times) / len(self.calc_loop_times),
-            'calc_loop_max_ms': max(self.calc_loop_times),
-            'calc_loop_min_ms': min(self.calc_loop_times),
+    def _publish_performance_stats(self):
+        """
+        Recompute the stats snapshot from recent loop times (calc thread only).
+        """
+        times = self.calc_loop_times
+
+        self._stats_snapshot = {
+            'calc_loop_avg_ms': sum(times) / len(times),
+            'calc_loop_max_ms': max(times),
+            'calc_loop_min_ms': min(times),
             'calc_rate_hz': self.calc_rate_hz,
         }
 
 
+async def _wait_for_any(*events: asyncio.Event):
+    """Wait until at least one of the events is set"""
+    waiters = [asyncio.ensure_future(event.wait()) for event in events]
+    try:
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
 # Helper function for UI broadcast loop (to be used in FastAPI)
 async def ui_broadcast_loop(
     rate_controller: RateController,
     websocket_manager: 'WebSocketManager',
     session_manager: Optional['SessionManager'] = None,
-    broadcast_rate_hz: float = 10.0
+    broadcast_rate_hz: float = 10.0,
+    stop_event: Optional[asyncio.Event] = None
 ):
     """
     Asyncio task for broadcasting metrics and device status to WebSocket clients.
@@ -434,6 +477,8 @@ async def ui_broadcast_loop(
         websocket_manager: WebSocketManager instance from main.py
         session_manager: Optional SessionManager instance for device status
         broadcast_rate_hz: Broadcast rate in Hz (default 10.0 = 100ms intervals)
+        stop_event: Set to stop the loop after the current tick (cooperative
+            shutdown; without it the loop runs until the task is cancelled)
 
     Usage in main.py:
         @app.on_event("startup")
@@ -446,16 +491,28 @@ async def ui_broadcast_loop(
 
     broadcast_interval = 1.0 / broadcast_rate_hz
 
-    while True:
+    # Ticks are scheduled on absolute deadlines (loop clock), so sleep overshoot
+    # and scheduler jitter don't accumulate into a slower-than-nominal rate
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+
+    if stop_event is None:
+        stop_event = asyncio.Event()  # Never set
+
+    while not stop_event.is_set():
         try:
-            loop_start = time.time()
+            # Nobody to send to: sleep until a client connects (or a stop is
+            # requested) instead of building unused frames at 10 Hz
+            if not websocket_manager.has_clients.is_set():
+                logger.debug("UI broadcast idle (no clients)")
+                await _wait_for_any(websocket_manager.has_clients, stop_event)
+                next_tick = loop.time()
+                continue
 
-            # Get latest metrics (thread-safe read from shared state)
-            metrics_data = rate_controller.get_metrics_json()
+            loop_start = loop.time()
 
-            # Parse JSON and add additional fields
-            import json
-            metrics_dict = json.loads(metrics_data)
+            # Get latest metrics (thread-safe read from shared state)
+            metrics_dict = rate_controller.get_metrics_dict()
 
             # Add connected devices list (from stream handlers)
             connected_devices = list(rate_controller.stream_handlers.keys())
@@ -471,29 +528,51 @@ async def ui_broadcast_loop(
             for device_name, handler in rate_controller.stream_handlers.items():
                 data = handler.get_recent_data(duration=1.0)  # 1 second = 256 samples @ 256 Hz
                 if data is not None:
-                    # Convert numpy arrays to lists for JSON serialization
+                    # Keep samples as NumPy arrays - orjson/ormsgpack encode them directly
+                    # (no per-sample Python float objects). They require C-contiguous input.
                     # Downsample by factor of 2 to reduce WebSocket bandwidth (128 samples for 1s display)
                     raw_data[device_name] = {
-                        ch_name: samples[::2].tolist()  # Every 2nd sample = 128 points
+                        ch_name: np.ascontiguousarray(samples[::2])  # Every 2nd sample = 128 points
                         for ch_name, samples in data.items()
                     }
 
             metrics_dict["raw_data"] = raw_data
 
-            metrics_json = json.dumps(metrics_dict)
-
-            # Broadcast to all connected WebSocket clients
+            # Serialize once per tick per framing actually in use - the same payload
+            # is sent to every client of that framing
             if websocket_manager.active_connections:
-                await websocket_manager.broadcast(metrics_json)
-
-            # Rate limiting
-            elapsed = time.time() - loop_start
-            sleep_time = max(0, broadcast_interval - elapsed)
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+                metrics_json = None
+                metrics_msgpack = None
+
+                if websocket_manager.has_text_clients:
+                    # Decoded to str so JSON clients receive text frames (JSON.parse in frontend)
+                    metrics_json = orjson.dumps(metrics_dict, option=ORJSON_OPTIONS).decode()
+
+                if websocket_manager.binary_connections:
+                    # Binary clients: msgpack floats are 9 bytes vs ~20 chars of JSON
+                    metrics_msgpack = ormsgpack.packb(metrics_dict, option=ORMSGPACK_OPTIONS)
+
+                # Broadcast to all connected WebSocket clients
+                await websocket_manager.broadcast(metrics_json, metrics_msgpack)
+
+            # Rate limiting: sleep until the next deadline
+            now = loop.time()
+            next_tick += broadcast_interval
+            if next_tick > now:
+                # Sleep, but wake immediately if a stop is requested
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=next_tick - now)
+                except asyncio.TimeoutError:
+                    pass
             else:
-                logger.debug(f"UI broadcast exceeded budget: {elapsed*1000:.1f}ms")
+                logger.debug("UI broadcast exceeded budget: %.1fms", (now - loop_start) * 1000)
+                # More than a full tick behind: resynchronize instead of bursting
+                # through the missed ticks back-to-back
+                if now - next_tick > broadcast_interval:
+                    next_tick = now
 
         except Exception as e:
             logger.error(f"Error in UI broadcast loop: {e}", exc_info=True)
             await asyncio.sleep(0.1)
+
+    logger.info("UI broadcast loop stopped")
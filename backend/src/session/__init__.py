@@ -3,5 +3,6 @@ Session Management - Experimental session lifecycle and data recording
 """
 from .manager import SessionManager, SessionPhase, SessionConfig
 from .storage import DataRecorder
+from .markers import MarkerOutlet
 
-__all__ = ['SessionManager', 'SessionPhase', 'SessionConfig', 'DataRecorder']
+__all__ = ['SessionManager', 'SessionPhase', 'SessionConfig', 'DataRecorder', 'MarkerOutlet']
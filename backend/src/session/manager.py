@@ -46,11 +46,10 @@ Usage:
 import logging
 import time
 import uuid
-from typing import Dict, List, Optional, Set
+from typing import Collection, Dict, List, Optional, Set, Tuple
 from enum import Enum
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-import json
 
 logger = logging.getLogger(__name__)
 
@@ -258,16 +257,20 @@ class SessionManager:
     - Phase transitions and timing
     """
 
+    STATUS_CACHE_TTL = 0.1  # Seconds (one UI tick @ 10 Hz)
+
     def __init__(
         self,
-        devices: List[str],
+        devices: Collection[str],
         data_recorder: Optional['DataRecorder'] = None
     ):
         """
         Initialize session manager.
 
         Args:
-            devices: List of available device names (e.g., ['Muse_1', 'Muse_2'])
+            devices: Available device names (e.g., ['Muse_1', 'Muse_2']). May be a
+                live view such as a mapping keyed by stream name, so membership
+                stays current without reassigning this attribute
             data_recorder: DataRecorder instance for CSV export (optional)
         """
         self.devices = devices
@@ -281,6 +284,11 @@ class SessionManager:
 
         # Protocol library
         self.protocols: Dict[str, ExperimentalProtocol] = BUILTIN_PROTOCOLS.copy()
+        self.protocols_version = 0  # Bumped on library changes (invalidates cached listings)
+
+        # Last computed status: (time.monotonic(), status). The UI polls status
+        # alongside the WebSocket feed, so reuse it for STATUS_CACHE_TTL seconds
+        self._status_cache: Optional[Tuple[float, SessionStatus]] = None
 
         logger.info(f"SessionManager initialized with {len(devices)} devices")
 
@@ -301,6 +309,7 @@ class SessionManager:
 
         protocol_key = protocol.name.lower().replace(' ', '_')
         self.protocols[protocol_key] = protocol
+        self.protocols_version += 1
         logger.info(f"Protocol '{protocol.name}' added to library")
         return True
 
@@ -426,6 +435,7 @@ class SessionManager:
         else:
             self.current_phase = SessionPhase.BASELINE  # Default
 
+        self._status_cache = None
         logger.info(
             f"✓ Session started: {session_id} | Protocol: {protocol.name} | "
             f"Devices: {list(subject_ids.keys())}"
@@ -460,6 +470,7 @@ class SessionManager:
         self.phase_start_time = None
         self.phase_index = 0
         self.current_phase = SessionPhase.IDLE
+        self._status_cache = None
 
         return True
 
@@ -469,6 +480,7 @@ class SessionManager:
             return False
 
         self.current_phase = SessionPhase.PAUSED
+        self._status_cache = None
         logger.info(f"Session paused: {self.current_session.session_id}")
         return True
 
@@ -486,6 +498,7 @@ class SessionManager:
         else:
             self.current_phase = SessionPhase.TRAINING
 
+        self._status_cache = None
         logger.info(f"Session resumed: {self.current_session.session_id}")
         return True
 
@@ -529,6 +542,7 @@ class SessionManager:
             else:
                 self.current_phase = SessionPhase.TRAINING
 
+            self._status_cache = None
             logger.info(f"Phase transition: {next_phase.name} ({self.current_phase.value})")
             return True
 
@@ -540,7 +554,22 @@ class SessionManager:
 
         Returns:
             SessionStatus with current progress and configuration
+
+        Note:
+            Results are reused for STATUS_CACHE_TTL seconds, so timing fields
+            may lag by up to one UI tick. State changes (start/stop, pause,
+            phase transitions) invalidate the cache immediately.
         """
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < self.STATUS_CACHE_TTL:
+            return self._status_cache[1]
+
+        status = self._compute_session_status()
+        self._status_cache = (now, status)
+        return status
+
+    def _compute_session_status(self) -> SessionStatus:
+        """Build a fresh SessionStatus (uncached)"""
         if self.current_session is None:
             return SessionStatus(
                 is_active=False,
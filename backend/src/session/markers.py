@@ -0,0 +1,99 @@
+"""
+Marker Outlet - Publish session event markers as an LSL stream
+
+Event markers (stimulus onsets, phase changes, experimenter notes) are pushed
+to an irregular-rate string LSL stream so any LSL consumer (LabRecorder,
+muselsl record, analysis scripts) gets them time-aligned with the EEG streams.
+
+Design:
+- One outlet for the whole backend, created at startup
+- chunk_size=0: each marker is sent immediately, no batching delay
+- Wall-clock timestamps from the API are mapped onto the LSL clock
+  (pylsl.local_clock) so markers line up with EEG sample timestamps
+
+Usage:
+    outlet = MarkerOutlet()
+    timestamp, lsl_timestamp = outlet.push("stimulus_onset")
+"""
+
+import logging
+import time
+import threading
+from typing import Optional, Tuple
+from pylsl import StreamInfo, StreamOutlet, local_clock, IRREGULAR_RATE
+
+logger = logging.getLogger(__name__)
+
+
+class MarkerOutlet:
+    """
+    LSL outlet for string event markers.
+
+    Thread-safe - push() may be called from worker threads.
+    """
+
+    def __init__(
+        self,
+        stream_name: str = "ExG-Lab-Markers",
+        source_id: str = "exglab-markers",
+        max_buffered: int = 360
+    ):
+        """
+        Create the marker stream outlet.
+
+        Args:
+            stream_name: LSL stream name consumers resolve by
+            source_id: Stable source ID so consumers can reconnect after restarts
+            max_buffered: Seconds of markers buffered for slow consumers
+        """
+        info = StreamInfo(
+            name=stream_name,
+            type='Markers',
+            channel_count=1,
+            nominal_srate=IRREGULAR_RATE,
+            channel_format='string',
+            source_id=source_id
+        )
+
+        self.stream_name = stream_name
+        self.outlet: Optional[StreamOutlet] = StreamOutlet(info, chunk_size=0, max_buffered=max_buffered)
+        self.lock = threading.Lock()
+
+        logger.info(f"MarkerOutlet created ('{stream_name}')")
+
+    def push(self, label: str, timestamp: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Push a marker to the LSL stream.
+
+        Args:
+            label: Marker label
+            timestamp: Wall-clock time of the event (time.time()), or None for now
+
+        Returns:
+            (wall-clock timestamp, LSL timestamp) of the marker - the LSL one
+            lines up with the EEG timestamps in the recorded CSVs
+        """
+        now_wall = time.time()
+        now_lsl = local_clock()
+
+        if timestamp is None:
+            timestamp = now_wall
+
+        # Map wall-clock time onto the LSL clock used by EEG sample timestamps
+        lsl_timestamp = now_lsl - (now_wall - timestamp)
+
+        with self.lock:
+            if self.outlet is None:
+                logger.warning(f"Marker '{label}' dropped - outlet closed")
+                return timestamp, lsl_timestamp
+
+            self.outlet.push_sample([label], lsl_timestamp)
+
+        return timestamp, lsl_timestamp
+
+    def close(self):
+        """Release the outlet (consumers see the stream disappear)"""
+        with self.lock:
+            self.outlet = None
+
+        logger.info(f"MarkerOutlet closed ('{self.stream_name}')")
@@ -13,6 +13,7 @@ sessions/
 │   ├── metadata.json          # Session configuration and info
 │   ├── Muse_1_P001.csv        # Raw EEG data for device 1
 │   ├── Muse_2_P002.csv        # Raw EEG data for device 2
+│   ├── markers.csv            # Event markers (timestamp,wall_time,label)
 │   └── ...
 
 CSV Format:
@@ -33,6 +34,7 @@ Usage:
 
     # During session (called by LSLStreamHandler or RateController)
     recorder.record_sample('Muse_1', timestamp, [12.5, 8.3, 7.1, 11.2])
+    recorder.record_marker(lsl_timestamp, wall_time, 'eyes_closed')
 
     # Stop recording
     files = recorder.stop_recording()
@@ -41,15 +43,18 @@ Usage:
 import logging
 import os
 import csv
-import json
 import threading
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 import time
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+MARKERS_FILENAME = 'markers.csv'
+
 
 class DataRecorder:
     """
@@ -97,9 +102,18 @@ class DataRecorder:
         self.buffers: Dict[str, List[Tuple[float, List[float]]]] = {}
         self.buffer_lock = threading.Lock()
 
+        # Event markers (written immediately - they are rare)
+        self.markers_file = None
+        self.markers_writer: Optional[csv.writer] = None
+        self.marker_count = 0
+
         # Statistics
         self.sample_counts: Dict[str, int] = {}
 
+        # Bumped whenever a session is created or finalized on disk
+        # (invalidates cached session listings)
+        self.sessions_version = 0
+
         logger.info(f"DataRecorder initialized (base_dir: {base_dir})")
 
     def start_recording(
@@ -141,8 +155,7 @@ class DataRecorder:
                 **(metadata or {})
             }
 
-            with open(metadata_file, 'w') as f:
-                json.dump(full_metadata, f, indent=2)
+            metadata_file.write_bytes(orjson.dumps(full_metadata, option=orjson.OPT_INDENT_2))
 
             # Open CSV files for each device
             for device_name, subject_id in subject_ids.items():
@@ -164,7 +177,14 @@ class DataRecorder:
                 self.buffers[device_name] = []
                 self.sample_counts[device_name] = 0
 
+            # Markers share the EEG files' LSL timestamps so they can be aligned
+            self.markers_file = open(self.session_dir / MARKERS_FILENAME, 'w', newline='')
+            self.markers_writer = csv.writer(self.markers_file)
+            self.markers_writer.writerow(['timestamp', 'wall_time', 'label'])
+            self.marker_count = 0
+
             self.is_recording = True
+            self.sessions_version += 1
 
             logger.info(f"✓ Recording started: {session_id} ({len(subject_ids)} devices)")
             return True
@@ -246,6 +266,28 @@ class DataRecorder:
             if len(self.buffers[device_name]) >= self.buffer_size:
                 self._flush_buffer(device_name)
 
+    def record_marker(self, timestamp: float, wall_time: float, label: str):
+        """
+        Record an event marker (no-op when not recording).
+
+        Thread-safe. Written and flushed immediately so markers survive a crash.
+
+        Args:
+            timestamp: LSL timestamp (same clock as the EEG CSVs)
+            wall_time: Wall-clock time of the event (time.time())
+            label: Marker label
+        """
+        with self.buffer_lock:
+            if not self.is_recording or self.markers_writer is None:
+                return
+
+            try:
+                self.markers_writer.writerow([timestamp, wall_time, label])
+                self.markers_file.flush()
+                self.marker_count += 1
+            except Exception as e:
+                logger.error(f"Error writing marker '{label}': {e}")
+
     def _flush_buffer(self, device_name: str):
         """
         Write buffered samples to CSV file.
@@ -305,20 +347,25 @@ class DataRecorder:
                 csv_path = self.session_dir / f"{device_name}_{self.subject_ids[device_name]}.csv"
                 file_paths[device_name] = str(csv_path)
 
+            with self.buffer_lock:
+                if self.markers_file is not None:
+                    self.markers_file.close()
+                self.markers_file = None
+                self.markers_writer = None
+
             # Update metadata with end time and sample counts
             metadata_file = self.session_dir / 'metadata.json'
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+            metadata = orjson.loads(metadata_file.read_bytes())
 
             metadata['end_time'] = datetime.now().isoformat()
             metadata['sample_counts'] = self.sample_counts.copy()
+            metadata['marker_count'] = self.marker_count
             metadata['duration_seconds'] = (
                 datetime.fromisoformat(metadata['end_time']) -
                 datetime.fromisoformat(metadata['start_time'])
             ).total_seconds()
 
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            metadata_file.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
             # Log statistics
             total_samples = sum(self.sample_counts.values())
@@ -328,6 +375,8 @@ class DataRecorder:
                 f"Files: {list(file_paths.values())}"
             )
 
+            self.sessions_version += 1
+
             # Reset state
             self.is_recording = False
             self.session_id = None
@@ -381,11 +430,10 @@ class DataRecorder:
                 if not metadata_file.exists():
                     continue
 
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
+                metadata = orjson.loads(metadata_file.read_bytes())
 
-                # Get CSV files
-                csv_files = list(session_dir.glob('*.csv'))
+                # Get EEG CSV files (one per device)
+                csv_files = [path for path in session_dir.glob('*.csv') if path.name != MARKERS_FILENAME]
 
                 sessions.append({
                     'session_id': metadata.get('session_id'),
@@ -421,8 +469,7 @@ class DataRecorder:
             return None
 
         try:
-            with open(metadata_file, 'r') as f:
-                return json.load(f)
+            return orjson.loads(metadata_file.read_bytes())
         except Exception as e:
             logger.error(f"Error reading metadata for {session_id}: {e}")
             return None
@@ -0,0 +1,11 @@
+"""
+Shared pytest setup - makes the backend package root importable
+(`src.*` modules and `main`) when pytest is run from backend/
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep DeviceManager instances from reading/writing ~/.cache/exg-lab/devices.json
+os.environ.setdefault('EXG_DEVICE_CACHE', 'false')
@@ -0,0 +1,110 @@
+"""Tests for ChunkStore growth, spill, snapshot and block reads"""
+import numpy as np
+import pytest
+
+from src.devices.chunk_store import ChunkStore
+
+
+def chunk(start: int, stop: int, n_channels: int = 3):
+    """(timestamps, samples) whose values encode the row index"""
+    timestamps = np.arange(start, stop, dtype=np.float64)
+    samples = np.repeat(timestamps[:, None], n_channels, axis=1).astype(np.float32)
+    return timestamps, samples
+
+
+def fill(store: ChunkStore, n_rows: int, chunk_size: int = 4):
+    for start in range(0, n_rows, chunk_size):
+        store.append(*chunk(start, min(start + chunk_size, n_rows)))
+
+
+def test_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        ChunkStore(n_channels=3, initial_capacity=0)
+
+
+def test_grows_and_keeps_rows():
+    store = ChunkStore(n_channels=3, initial_capacity=5)
+    fill(store, 23)
+
+    assert len(store) == 23
+    assert store.capacity >= 23
+    assert store.spilled == 0
+
+    timestamps, samples = store.snapshot()
+    expected_ts, expected_samples = chunk(0, 23)
+    np.testing.assert_array_equal(timestamps, expected_ts)
+    np.testing.assert_array_equal(samples, expected_samples)
+
+
+def test_chunk_larger_than_double_capacity():
+    store = ChunkStore(n_channels=3, initial_capacity=2)
+    store.append(*chunk(0, 9))
+
+    assert len(store) == 9
+    np.testing.assert_array_equal(store.snapshot()[0], chunk(0, 9)[0])
+
+
+def test_spill_bounds_memory_and_snapshot_is_complete():
+    store = ChunkStore(n_channels=3, initial_capacity=6, spill=True)
+    fill(store, 50)
+
+    assert len(store) == 50
+    assert store.capacity == 6  # Spilled instead of growing
+    assert store.spilled > 0
+    assert store.count <= store.capacity
+
+    timestamps, samples = store.snapshot()
+    expected_ts, expected_samples = chunk(0, 50)
+    np.testing.assert_array_equal(timestamps, expected_ts)
+    np.testing.assert_array_equal(samples, expected_samples)
+    assert samples.dtype == np.float32
+
+
+@pytest.mark.parametrize('spill', [False, True])
+def test_read_blocks_cover_all_rows(spill):
+    store = ChunkStore(n_channels=3, initial_capacity=6, spill=spill)
+    fill(store, 50)
+
+    blocks = [store.read(start, 7) for start in range(0, 50, 7)]
+    np.testing.assert_array_equal(np.concatenate([b[0] for b in blocks]), chunk(0, 50)[0])
+    np.testing.assert_array_equal(np.concatenate([b[1] for b in blocks]), chunk(0, 50)[1])
+
+    # Past the end
+    timestamps, samples = store.read(50, 7)
+    assert timestamps.shape == (0,)
+    assert samples.shape == (0, 3)
+
+
+def test_read_straddles_spill_file_and_memory():
+    store = ChunkStore(n_channels=3, initial_capacity=6, spill=True)
+    fill(store, 16)
+    boundary = store.spilled
+
+    timestamps, _ = store.read(boundary - 2, 4)
+    np.testing.assert_array_equal(timestamps, chunk(boundary - 2, boundary + 2)[0])
+
+
+def test_snapshot_is_a_copy():
+    store = ChunkStore(n_channels=3, initial_capacity=8)
+    fill(store, 4)
+
+    timestamps, samples = store.snapshot()
+    timestamps[:] = -1
+    samples[:] = -1
+
+    np.testing.assert_array_equal(store.snapshot()[0], chunk(0, 4)[0])
+
+
+@pytest.mark.parametrize('spill', [False, True])
+def test_clear_discards_rows(spill):
+    store = ChunkStore(n_channels=3, initial_capacity=6, spill=spill)
+    fill(store, 30)
+    store.clear()
+
+    assert len(store) == 0
+    assert store.spilled == 0
+    assert store.snapshot()[0].shape == (0,)
+
+    # Reusable after clear - no rows from before it reappear
+    fill(store, 10)
+    np.testing.assert_array_equal(store.snapshot()[0], chunk(0, 10)[0])
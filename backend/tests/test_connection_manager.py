@@ -0,0 +1,98 @@
+"""Tests for ConnectionManager per-client queues (stale frames are dropped)"""
+import asyncio
+
+import main
+
+
+class FakeWebSocket:
+    """WebSocket stand-in whose sends block until the test releases them"""
+
+    def __init__(self, subprotocols=()):
+        self.scope = {'subprotocols': list(subprotocols)}
+        self.sent = []
+        self.gate = asyncio.Event()
+
+    async def accept(self, subprotocol=None):
+        self.subprotocol = subprotocol
+
+    async def send_text(self, message):
+        await self.gate.wait()
+        self.sent.append(message)
+
+    async def send_bytes(self, message):
+        await self.gate.wait()
+        self.sent.append(message)
+
+
+async def settle():
+    """Let sender tasks run until they block"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_slow_client_gets_newest_frame_only():
+    async def run():
+        manager = main.ConnectionManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+
+        await manager.broadcast('frame-0')
+        await settle()  # Sender is now blocked sending frame-0
+
+        for i in range(1, 10):
+            await manager.broadcast(f'frame-{i}')
+
+        # Queue is bounded - the oldest frames were dropped
+        assert manager.outbound_queues[websocket].qsize() == manager.CLIENT_QUEUE_SIZE
+
+        websocket.gate.set()
+        await settle()
+        manager.disconnect(websocket)
+        return websocket.sent
+
+    # In-flight frame, then straight to the newest one
+    assert asyncio.run(run()) == ['frame-0', 'frame-9']
+
+
+def test_broadcast_does_not_wait_for_slow_client():
+    async def run():
+        manager = main.ConnectionManager()
+        slow, fast = FakeWebSocket(), FakeWebSocket()
+        fast.gate.set()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        for i in range(3):
+            await asyncio.wait_for(manager.broadcast(f'frame-{i}'), timeout=1.0)
+            await settle()
+
+        sent = (list(slow.sent), list(fast.sent))
+        manager.disconnect(slow)
+        manager.disconnect(fast)
+        return sent
+
+    slow_sent, fast_sent = asyncio.run(run())
+    assert slow_sent == []
+    assert fast_sent == ['frame-0', 'frame-1', 'frame-2']
+
+
+def test_binary_clients_receive_msgpack_payload():
+    async def run():
+        manager = main.ConnectionManager()
+        text, binary = FakeWebSocket(), FakeWebSocket(subprotocols=['msgpack'])
+        text.gate.set()
+        binary.gate.set()
+        await manager.connect(text)
+        await manager.connect(binary)
+
+        await manager.broadcast('{"t": 1}', binary_message=b'\x81\xa1t\x01')
+        await settle()
+
+        for websocket in (text, binary):
+            manager.disconnect(websocket)
+        assert not manager.has_clients.is_set()
+        return text.sent, binary.sent
+
+    text_sent, binary_sent = asyncio.run(run())
+    assert text_sent == ['{"t": 1}']
+    assert binary_sent == [b'\x81\xa1t\x01']
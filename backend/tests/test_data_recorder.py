@@ -0,0 +1,31 @@
+"""Tests for DataRecorder event markers"""
+import csv
+
+from src.session import DataRecorder
+from src.session.storage import MARKERS_FILENAME
+
+
+def test_markers_written_while_recording(tmp_path):
+    recorder = DataRecorder(base_dir=str(tmp_path))
+    recorder.record_marker(1.0, 1000.0, 'before_start')  # Ignored - not recording
+
+    assert recorder.start_recording('session_1', subject_ids={'Muse_1': 'P001'})
+    recorder.record_marker(12.5, 1012.5, 'eyes_closed')
+    recorder.record_marker(42.0, 1042.0, 'eyes_open')
+    recorder.stop_recording()
+
+    recorder.record_marker(50.0, 1050.0, 'after_stop')  # Ignored - not recording
+
+    with open(tmp_path / 'session_1' / MARKERS_FILENAME, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        ['timestamp', 'wall_time', 'label'],
+        ['12.5', '1012.5', 'eyes_closed'],
+        ['42.0', '1042.0', 'eyes_open'],
+    ]
+
+    metadata = recorder.get_session_metadata('session_1')
+    assert metadata['marker_count'] == 2
+
+    # markers.csv isn't counted as a device file
+    assert recorder.list_sessions()[0]['num_files'] == 1
@@ -0,0 +1,54 @@
+"""Tests for DeviceManager scan sharing (single-flight) and timeouts"""
+import asyncio
+import time
+
+from src.devices.manager import Device, DeviceManager
+
+
+def make_manager(monkeypatch):
+    """DeviceManager whose BLE scan sleeps out its window and records each call"""
+    manager = DeviceManager(validate=False)
+    calls = []
+
+    async def fake_scan(timeout, expected_count=None):
+        calls.append(timeout)
+        await asyncio.sleep(timeout)
+        return [Device(name=f"Muse S - {timeout}", address=f"00:00:00:00:00:{len(calls):02X}", status="available")]
+
+    monkeypatch.setattr(manager, '_scan_with_bleak', fake_scan)
+    return manager, calls
+
+
+def test_short_timeout_does_not_join_longer_scan(monkeypatch):
+    manager, calls = make_manager(monkeypatch)
+
+    async def run():
+        long_scan = asyncio.ensure_future(manager.scan_devices_async(timeout=2.0, force_refresh=True))
+        await asyncio.sleep(0.05)
+
+        start = time.monotonic()
+        devices = await manager.scan_devices_async(timeout=0.1, force_refresh=True)
+        elapsed = time.monotonic() - start
+
+        long_scan.cancel()
+        return devices, elapsed
+
+    devices, elapsed = asyncio.run(run())
+    assert calls == [2.0, 0.1]  # Ran its own scan
+    assert elapsed < 1.0
+    assert devices[0].name == "Muse S - 0.1"
+
+
+def test_caller_joins_scan_that_ends_within_its_timeout(monkeypatch):
+    manager, calls = make_manager(monkeypatch)
+
+    async def run():
+        first = asyncio.ensure_future(manager.scan_devices_async(timeout=0.2, force_refresh=True))
+        await asyncio.sleep(0.05)
+        second = await manager.scan_devices_async(timeout=0.5, force_refresh=True)
+        return await first, second
+
+    first, second = asyncio.run(run())
+    assert calls == [0.2]  # One shared scan
+    assert first == second
+    assert first is not second  # Each caller gets its own list
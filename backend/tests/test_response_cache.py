@@ -0,0 +1,68 @@
+"""Tests for the ETag-cached list endpoints (/api/protocols, /api/sessions)"""
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from src.session import DataRecorder, SessionManager
+from src.session.manager import BUILTIN_PROTOCOLS
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    """App client without lifespan (no devices/processor), with fresh managers"""
+    recorder = DataRecorder(base_dir=str(tmp_path))
+    monkeypatch.setattr(main, 'data_recorder', recorder)
+    monkeypatch.setattr(main, 'session_manager', SessionManager(devices=[], data_recorder=recorder))
+    monkeypatch.setattr(main, 'response_cache', {})
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize('path', ['/api/protocols', '/api/sessions'])
+def test_matching_etag_returns_304(client, path):
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers['etag']
+
+    second = client.get(path, headers={'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.headers['etag'] == etag
+    assert second.content == b''
+
+
+def test_stale_etag_returns_body(client):
+    response = client.get('/api/protocols', headers={'If-None-Match': 'W/"protocols-0-999"'})
+
+    assert response.status_code == 200
+    assert response.json()['success'] is True
+
+
+def test_protocols_version_change_invalidates(client):
+    first = client.get('/api/protocols')
+    names = {protocol['name'] for protocol in first.json()['protocols']}
+
+    custom = replace(next(iter(BUILTIN_PROTOCOLS.values())), name='Custom Test Protocol')
+    assert main.session_manager.add_protocol(custom)
+
+    second = client.get('/api/protocols', headers={'If-None-Match': first.headers['etag']})
+    assert second.status_code == 200
+    assert second.headers['etag'] != first.headers['etag']
+    assert {protocol['name'] for protocol in second.json()['protocols']} == names | {'Custom Test Protocol'}
+
+
+def test_sessions_version_change_invalidates(client, monkeypatch):
+    first = client.get('/api/sessions')
+    assert first.json()['sessions'] == []
+
+    # Cached body is reused while the version is unchanged
+    listing = [{'session_id': 'session_1'}]
+    monkeypatch.setattr(main.data_recorder, 'list_sessions', lambda: listing)
+    assert client.get('/api/sessions').json()['sessions'] == []
+
+    main.data_recorder.sessions_version += 1
+
+    second = client.get('/api/sessions', headers={'If-None-Match': first.headers['etag']})
+    assert second.status_code == 200
+    assert second.headers['etag'] != first.headers['etag']
+    assert second.json()['sessions'] == listing
@@ -0,0 +1,71 @@
+"""Tests for RingBuffer wrap-around reads"""
+import numpy as np
+
+from src.devices.ring_buffer import RingBuffer
+
+
+def rows(start: int, stop: int) -> np.ndarray:
+    """Samples whose channel values encode their index (row i = [i, 10 i])"""
+    index = np.arange(start, stop, dtype=np.float32)
+    return np.column_stack((index, 10 * index))
+
+
+def test_latest_before_full():
+    ring = RingBuffer(capacity=8, n_channels=2)
+    ring.push(rows(0, 5))
+
+    assert len(ring) == 5
+    np.testing.assert_array_equal(ring.latest(3), rows(2, 5))
+    assert ring.latest(6) is None
+
+
+def test_latest_across_wrap_point():
+    ring = RingBuffer(capacity=8, n_channels=2)
+    ring.push(rows(0, 6))
+    ring.push(rows(6, 11))  # Wraps: head ends at 3
+
+    assert len(ring) == 8
+    assert ring.head == 3
+    np.testing.assert_array_equal(ring.latest(8), rows(3, 11))
+    np.testing.assert_array_equal(ring.latest(5), rows(6, 11))
+    np.testing.assert_array_equal(ring.latest(2), rows(9, 11))
+
+
+def test_latest_when_write_ends_at_array_end():
+    ring = RingBuffer(capacity=8, n_channels=2)
+    ring.push(rows(0, 8))  # head wraps to 0
+
+    assert ring.head == 0
+    np.testing.assert_array_equal(ring.latest(8), rows(0, 8))
+    np.testing.assert_array_equal(ring.last(), rows(7, 8)[0])
+
+
+def test_last_across_wrap_point():
+    ring = RingBuffer(capacity=8, n_channels=2)
+    assert ring.last() is None
+
+    ring.push(rows(0, 7))
+    ring.push(rows(7, 9))  # Second chunk wraps: head ends at 1
+
+    assert ring.head == 1
+    np.testing.assert_array_equal(ring.last(), rows(8, 9)[0])
+
+
+def test_push_larger_than_capacity_keeps_newest():
+    ring = RingBuffer(capacity=8, n_channels=2)
+    ring.push(rows(0, 3))
+    ring.push(rows(3, 23))
+
+    np.testing.assert_array_equal(ring.latest(8), rows(15, 23))
+
+
+def test_single_channel_push_and_clear():
+    ring = RingBuffer(capacity=4, n_channels=1, dtype=np.float64)
+    ring.push(np.arange(6, dtype=np.float64))
+
+    np.testing.assert_array_equal(ring.latest(4)[:, 0], [2, 3, 4, 5])
+
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.latest(1) is None
+    assert ring.last() is None
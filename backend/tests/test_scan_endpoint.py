@@ -0,0 +1,23 @@
+"""Tests for /api/devices/scan query validation"""
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture
+def client():
+    """App client without lifespan - invalid queries are rejected before the handler runs"""
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize('expected', [0, -1])
+def test_rejects_non_positive_expected(client, expected):
+    response = client.get('/api/devices/scan', params={'expected': expected})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize('fresh', [0, -5])
+def test_rejects_non_positive_fresh(client, fresh):
+    response = client.get('/api/devices/scan', params={'fresh': fresh})
+    assert response.status_code == 422